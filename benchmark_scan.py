@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Directory Scan Benchmark Tool
+
+Standalone script comparing the original per-extension recursive globs
+(4 image + 7 video patterns) with the single-pass os.scandir walker used by
+codev1.3.py, on a synthetic camera tree or an existing directory.
+
+Usage:
+    python benchmark_scan.py                      # 1M files in a temporary tree
+    python benchmark_scan.py --files 100000 --cameras 50
+    python benchmark_scan.py --root ./images_clips
+"""
+
+import os
+import sys
+import glob
+import time
+import shutil
+import argparse
+import tempfile
+import importlib.util
+from colorama import Fore, Style
+
+# The pipeline lives in codev1.3.py, which cannot be imported with a plain import statement
+pipeline_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'codev1.3.py')
+
+# Patterns scanned by the original get_jpeg_files / get_video_files
+glob_extensions = ['jpg', 'jpeg', 'JPG', 'JPEG', 'mp4', 'avi', 'mov', 'mkv', 'wmv', 'flv', 'webm']
+
+def load_pipeline_module():
+    """Load codev1.3.py as a module"""
+    spec = importlib.util.spec_from_file_location('codev1_3', pipeline_file)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def create_synthetic_tree(root, file_count, camera_count, files_per_dir=1000):
+    """Create empty files spread over camera_N/day_M folders (mostly clips, some snapshots and sidecars)"""
+    extensions = ['mp4'] * 6 + ['jpg', 'JPG', 'avi', 'txt']
+    created = 0
+    day = 0
+    while created < file_count:
+        for camera in range(1, camera_count + 1):
+            if created >= file_count:
+                break
+            folder = os.path.join(root, f'camera_{camera}', f'day_{day:04d}')
+            os.makedirs(folder, exist_ok=True)
+            for i in range(min(files_per_dir, file_count - created)):
+                extension = extensions[i % len(extensions)]
+                open(os.path.join(folder, f'clip_{i:05d}.{extension}'), 'w').close()
+            created += min(files_per_dir, file_count - created)
+        day += 1
+        print(f"  {created} / {file_count} files", end='\r')
+    print()
+
+def scan_with_glob(root):
+    files = []
+    for extension in glob_extensions:
+        files.extend(glob.glob(os.path.join(root, '**', f'*.{extension}'), recursive=True))
+    return files
+
+def benchmark_scans(pipeline, root):
+    """Time both scans; returns {name: (seconds, files found)} and the walker's time to first result"""
+    results = {}
+
+    start_time = time.perf_counter()
+    count = len(scan_with_glob(root))
+    results['glob x11'] = (time.perf_counter() - start_time, count)
+
+    start_time = time.perf_counter()
+    first_result = None
+    count = 0
+    for _ in pipeline.iter_media_files(root):
+        if first_result is None:
+            first_result = time.perf_counter() - start_time
+        count += 1
+    results['scandir'] = (time.perf_counter() - start_time, count)
+    return results, first_result
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the media file scan of the camera folders')
+    parser.add_argument('--root', type=str, help='Scan an existing directory instead of a synthetic tree')
+    parser.add_argument('--files', type=int, default=1_000_000, help='Number of files in the synthetic tree')
+    parser.add_argument('--cameras', type=int, default=100, help='Number of camera folders in the synthetic tree')
+    args = parser.parse_args()
+
+    pipeline = load_pipeline_module()
+
+    temp_dir = None
+    root = args.root
+    if root is None:
+        temp_dir = tempfile.mkdtemp()
+        root = temp_dir
+        print(f"Creating synthetic tree with {args.files} files in {args.cameras} camera folders...")
+        create_synthetic_tree(root, args.files, args.cameras)
+    elif not os.path.isdir(root):
+        print(f"{Fore.RED}Directory not found: {root}{Style.RESET_ALL}")
+        sys.exit(1)
+
+    try:
+        results, first_result = benchmark_scans(pipeline, root)
+        print(f"\n{Fore.CYAN}Media file scan of {root}{Style.RESET_ALL}")
+        print("-" * 60)
+        baseline_time = results['glob x11'][0]
+        for name, (elapsed, count) in results.items():
+            print(f"  {name:<10} {elapsed:8.3f}s  {count:8d} files  {baseline_time / elapsed:5.2f}x vs glob x11")
+        if first_result is not None:
+            print(f"  scandir first file after {first_result * 1000:.1f}ms")
+        if results['glob x11'][1] != results['scandir'][1]:
+            print(f"{Fore.YELLOW}  Note: file counts differ (the globs are case-sensitive per pattern, "
+                  f"the walker matches any case){Style.RESET_ALL}")
+    finally:
+        if temp_dir:
+            print("Removing synthetic tree...")
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Video Pipeline Benchmark Tool
+
+Standalone script to measure the CPU-side stages of the video pipeline
+(decoder backends / frame sampling / parallel segment decoding / frame encoding) on a synthetic clip, without calling the LLM.
+
+Usage:
+    python benchmark_video.py
+    python benchmark_video.py --duration 600 --interval 2
+    python benchmark_video.py --video ./images_clips/camera_1/video1.mp4
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import tracemalloc
+import contextlib
+from io import StringIO
+import importlib.util
+import cv2
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from colorama import Fore, Style
+
+# The pipeline lives in codev1.3.py, which cannot be imported with a plain import statement
+pipeline_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'codev1.3.py')
+
+def load_pipeline_module():
+    """Load codev1.3.py as a module (registered so decode worker processes can find it)"""
+    spec = importlib.util.spec_from_file_location('codev1_3', pipeline_file)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['codev1_3'] = module
+    spec.loader.exec_module(module)
+    return module
+
+# Loaded at import time: spawned worker processes re-import this script and
+# need the pipeline module registered before they unpickle their tasks
+pipeline = load_pipeline_module()
+
+def create_synthetic_video(path, duration_seconds=120, fps=30, width=1280, height=720):
+    """Write a synthetic clip with a moving box so every frame is different"""
+    fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+    writer = cv2.VideoWriter(path, fourcc, fps, (width, height))
+    if not writer.isOpened():
+        raise RuntimeError(f"Could not create synthetic video: {path}")
+
+    rng = np.random.default_rng(42)
+    background = rng.integers(0, 255, (height, width, 3), dtype=np.uint8)
+    total_frames = int(duration_seconds * fps)
+    for i in range(total_frames):
+        frame = background.copy()
+        x = (i * 7) % (width - 100)
+        y = (i * 3) % (height - 100)
+        cv2.rectangle(frame, (x, y), (x + 100, y + 100), (0, 0, 255), -1)
+        writer.write(frame)
+    writer.release()
+    return total_frames
+
+def benchmark_sampling_modes(video_path, interval_seconds, modes):
+    """Time the OpenCV decoder for each sampling mode"""
+    results = {}
+    for mode in modes:
+        start_time = time.time()
+        frame_numbers = [frame['frame_number'] for frame in pipeline.iter_frames_from_video(video_path, interval_seconds, sampling_mode=mode, backend='opencv')]
+        elapsed = time.time() - start_time
+        results[mode] = (elapsed, frame_numbers)
+    return results
+
+def benchmark_decoder_backends(video_path, interval_seconds):
+    """Time iter_frames_from_video for each available decoder backend"""
+    results = {}
+    for name, decoder_class in pipeline.decoder_classes.items():
+        if not decoder_class.is_available():
+            print(f"{Fore.YELLOW}Decoder backend '{name}' is not available, skipping{Style.RESET_ALL}")
+            continue
+        start_time = time.time()
+        frame_numbers = [frame['frame_number'] for frame in pipeline.iter_frames_from_video(video_path, interval_seconds, backend=name)]
+        results[name] = (time.time() - start_time, frame_numbers)
+    return results
+
+def benchmark_parallel_decoding(video_path, interval_seconds, worker_counts):
+    """Time iter_frames_parallel_segments for each number of decode processes"""
+    results = {}
+    start_time = time.time()
+    frame_numbers = [frame['frame_number'] for frame in pipeline.iter_frames_from_video(video_path, interval_seconds)]
+    results['1 proc'] = (time.time() - start_time, frame_numbers)
+    for workers in worker_counts:
+        start_time = time.time()
+        frame_numbers = [frame['frame_number'] for frame in pipeline.iter_frames_parallel_segments(video_path, interval_seconds, workers)]
+        results[f'{workers} procs'] = (time.time() - start_time, frame_numbers)
+    return results
+
+def _encode_via_pil(bgr):
+    """The original frame encode path: BGR -> RGB -> PIL image -> JPEG -> base64"""
+    rgb = cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
+    return pipeline.encode_image_for_model(pipeline.Image.fromarray(rgb))
+
+def benchmark_frame_encoding(video_path, frame_count=20, repeats=5, encode_workers=0):
+    """Per-frame time and peak Python-tracked allocations of the PIL and cv2.imencode encode paths
+
+    With encode_workers, also measures throughput of the shared-memory encode
+    pool with that many analysis threads encoding at once.
+    """
+    frames = []
+    for frame in pipeline.iter_frames_from_video(video_path, 1, backend='opencv'):
+        frames.append(frame['bgr'])
+        if len(frames) >= frame_count:
+            break
+
+    results = {}
+    for name, encode in (('pil', _encode_via_pil), ('imencode', pipeline.encode_frame_for_model)):
+        # Silence the per-request payload log while timing
+        with contextlib.redirect_stdout(StringIO()):
+            start_time = time.perf_counter()
+            for _ in range(repeats):
+                for bgr in frames:
+                    encode(bgr)
+            per_frame = (time.perf_counter() - start_time) / (repeats * len(frames))
+
+            tracemalloc.start()
+            encode(frames[0])
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        results[name] = (per_frame, peak)
+
+    if encode_workers:
+        # The same number of analysis threads encoding inline and through the pool
+        for name, workers in ((f'threads x{encode_workers}', 0), (f'pool x{encode_workers}', encode_workers)):
+            pipeline.encode_workers = workers
+            try:
+                with contextlib.redirect_stdout(StringIO()), ThreadPoolExecutor(max_workers=encode_workers) as executor:
+                    # Warm up the pool so process start-up is not timed
+                    list(executor.map(pipeline.encode_frame_for_model, frames[:encode_workers]))
+                    start_time = time.perf_counter()
+                    for _ in range(repeats):
+                        list(executor.map(pipeline.encode_frame_for_model, frames))
+                    per_frame = (time.perf_counter() - start_time) / (repeats * len(frames))
+            finally:
+                pipeline.encode_workers = 0
+            results[name] = (per_frame, 0)
+    return frames[0].shape, results
+
+def print_encoding_results(shape, results, baseline='pil'):
+    print(f"\n{Fore.CYAN}Frame encoding ({shape[1]}x{shape[0]} -> max {pipeline.max_image_dimension}px, per frame){Style.RESET_ALL}")
+    print("-" * 60)
+    baseline_time = results[baseline][0]
+    for name, (per_frame, peak) in results.items():
+        alloc = f"peak alloc {peak / 1024:8.1f} KB" if peak else " " * 22
+        print(f"  {name:<10} {per_frame * 1000:8.2f}ms  {alloc}  {baseline_time / per_frame:5.2f}x vs {baseline}")
+
+def print_results(title, results, baseline):
+    print(f"\n{Fore.CYAN}{title}{Style.RESET_ALL}")
+    print("-" * 60)
+    baseline_time = results[baseline][0]
+    for name, (elapsed, frame_numbers) in results.items():
+        speedup = baseline_time / elapsed if elapsed > 0 else float('inf')
+        print(f"  {name:<10} {elapsed:8.3f}s  {len(frame_numbers):6d} frames  {speedup:5.2f}x vs {baseline}")
+
+    reference = results[baseline][1]
+    for name, (_, frame_numbers) in results.items():
+        if frame_numbers != reference:
+            print(f"{Fore.YELLOW}  Warning: '{name}' sampled different frames than '{baseline}'{Style.RESET_ALL}")
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the CPU-side stages of the video pipeline')
+    parser.add_argument('--video', type=str, help='Benchmark an existing video instead of a synthetic clip')
+    parser.add_argument('--duration', type=int, default=120, help='Synthetic clip length in seconds')
+    parser.add_argument('--fps', type=int, default=30, help='Synthetic clip frame rate')
+    parser.add_argument('--interval', type=float, default=2, help='Frame extraction interval in seconds')
+    parser.add_argument('--decode-workers', type=int, nargs='*', default=[2, 4], help='Decode process counts to compare')
+    parser.add_argument('--encode-workers', type=int, default=2, help='Encode processes for the pool throughput run (0 = skip)')
+    parser.add_argument('--max-dimension', type=int, default=0,
+                        help='decoder_max_dimension for the decoder backend run (0 = full resolution)')
+    args = parser.parse_args()
+
+    temp_dir = None
+    video_path = args.video
+    if video_path is None:
+        temp_dir = tempfile.mkdtemp()
+        video_path = os.path.join(temp_dir, 'synthetic.mp4')
+        print(f"Creating {args.duration}s synthetic clip at {args.fps} fps...")
+        create_synthetic_video(video_path, args.duration, args.fps)
+    elif not os.path.exists(video_path):
+        print(f"{Fore.RED}Video file not found: {video_path}{Style.RESET_ALL}")
+        sys.exit(1)
+
+    try:
+        results = benchmark_sampling_modes(video_path, args.interval, ['read', 'grab', 'seek'])
+        print_results(f"OpenCV frame sampling ({args.interval}s interval)", results, 'read')
+
+        pipeline.decoder_max_dimension = args.max_dimension
+        results = benchmark_decoder_backends(video_path, args.interval)
+        pipeline.decoder_max_dimension = 0
+        scale = f", max dimension {args.max_dimension}" if args.max_dimension else ""
+        print_results(f"Decoder backends ({args.interval}s interval{scale})", results, 'opencv')
+
+        shape, results = benchmark_frame_encoding(video_path, encode_workers=args.encode_workers)
+        print_encoding_results(shape, results)
+
+        if args.decode_workers:
+            results = benchmark_parallel_decoding(video_path, args.interval, args.decode_workers)
+            print_results("Parallel segment decoding", results, '1 proc')
+    finally:
+        if temp_dir:
+            try:
+                os.remove(video_path)
+                os.rmdir(temp_dir)
+            except OSError:
+                print(f"Warning: Could not remove temporary files in {temp_dir}")
+
+if __name__ == '__main__':
+    main()
@@ -82,14 +82,22 @@ class VideoFrameDetails():
     detected_objects: list[dict]
     description: str = ''
     generated_with: str = ''
+    skip_reason: str = ''
+    deduplicated: bool = False
+    duplicate_of_frame: int = -1
+    person_count: int = -1
 
-    def __init__(self, file_name, timestamp, frame_number, detected_objects, description, generated_with):
+    def __init__(self, file_name, timestamp, frame_number, detected_objects, description, generated_with, skip_reason='', deduplicated=False, duplicate_of_frame=-1, person_count=-1):
         self.file_name = file_name
         self.timestamp = timestamp
         self.frame_number = frame_number
         self.detected_objects = detected_objects
         self.description = description
         self.generated_with = generated_with
+        self.skip_reason = skip_reason
+        self.deduplicated = deduplicated
+        self.duplicate_of_frame = duplicate_of_frame
+        self.person_count = person_count
 
     def to_dict(self):
         return {
@@ -99,6 +107,10 @@ class VideoFrameDetails():
             'detected_objects': self.get_detected_objects_text(),
             'description': self.description,
             'generated_with': self.generated_with,
+            'skip_reason': self.skip_reason,
+            'deduplicated': self.deduplicated,
+            'duplicate_of_frame': self.duplicate_of_frame,
+            'person_count': self.person_count,
             'content_type': 'video_frame'
         }
 
@@ -241,13 +253,27 @@ class ImageDetailsFactory:
 
 import os
 import time
+import asyncio
+import threading
+import multiprocessing
+from multiprocessing import shared_memory
+import atexit
+import hashlib
+import json
+import queue
 from contextlib import closing
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import sqlite3
 import base64
+import mmap
 from io import BytesIO
 from PIL import Image
-import glob
 import uuid
+import posixpath
+import shutil
+import subprocess
+import importlib.util
 import cv2
 import numpy as np
 import requests
@@ -290,6 +316,123 @@ embedding_model="nomic-embed-text:v1.5"
 # CSV logging configuration
 csv_output_dir = "./csv_logs"
 enable_csv_logging = True
+csv_fieldnames = [
+    'session_timestamp', 'file_path', 'content_type', 'timestamp_seconds', 
+    'frame_number', 'object_name', 'object_description', 'scene_description',
+    'make', 'model', 'camera_date', 'aperture_value', 'focal_length', 
+    'exposure_time', 'f_stops', 'iso', 'gps_coordinates', 'generated_with',
+    'processing_time_seconds', 'deduplicated'
+]
+
+# Frame sampling configuration
+# 'read' - decode and convert every frame, keep one per interval (original behaviour)
+# 'grab' - decode every frame but only retrieve/convert the sampled ones
+# 'seek' - jump straight to each sampled frame (best for long intervals / long clips)
+frame_sampling_mode = 'grab'
+video_interval_seconds = 2        # Frame interval used when processing the local camera folders
+
+# Video decoder backend. OpenCV is the default: it honours frame_sampling_mode, and
+# benchmark_video.py has not shown ffmpeg (subprocess pipe) or PyAV beating it, with or
+# without decoder-side downscaling. Both ignore frame_sampling_mode; measure before switching.
+decoder_backend = 'opencv'        # 'ffmpeg', 'pyav' or 'opencv'
+ffmpeg_binary = 'ffmpeg'
+decoder_max_dimension = 0         # Downscale decoded frames so the longest side fits (0 = full resolution)
+
+# Images sent to the vision model are shrunk so the longest side fits max_image_dimension
+# (the model rescales anything bigger anyway, so larger payloads only cost bandwidth)
+max_image_dimension = 672         # 0 = send full resolution
+jpeg_quality = 85
+enable_jpeg_passthrough = True    # Send JPEG photos that already fit as their original bytes (no re-encode)
+# Live stream mode (--stream): frames are sampled every stream_interval_seconds into a ring
+# buffer that keeps only the newest stream_buffer_size frames, so analysis never builds a backlog
+stream_interval_seconds = 2
+stream_buffer_size = 4
+stream_reconnect_seconds = 5      # Wait before reopening a live stream that stopped delivering frames
+
+# Watch mode (--watch): keep running and analyze new or changed files under root_image_dir.
+# Uses the optional watchdog package (inotify on Linux) when installed, otherwise polls the tree.
+watch_poll_seconds = 10
+watch_settle_seconds = 5          # A file is analyzed once its size and mtime stop changing for this long
+watch_keep_alive = 1800            # Seconds Ollama keeps the models loaded between files
+
+# Experimental: processes that resize/JPEG/base64-encode video frames while frame_concurrency
+# threads wait on the LLM (0 = encode in the analysis thread). benchmark_video.py has only been
+# run on a single core, where the pool was slower than encoding inline; measure on the target
+# machine before enabling it. Not passed to --workers ingestion processes, which already run
+# on their own cores.
+encode_workers = 0
+
+# Parallel segment decoding: videos longer than parallel_decode_min_seconds are
+# split into short time ranges decoded by decode_workers processes (1 = off)
+decode_workers = 1
+parallel_decode_min_seconds = 600
+decode_segment_frames = 8         # Sampled frames per segment handed to a decode process
+
+# Motion gating configuration
+# Frames whose motion score (fraction of changed pixels) is below the threshold
+# are not sent to the vision model. Thresholds can be overridden per camera folder.
+enable_motion_gate = False
+motion_gate_method = 'mog2'       # 'mog2' (background subtraction) or 'diff' (frame differencing)
+motion_threshold = 0.005          # Default threshold for all cameras
+camera_motion_thresholds = {}     # e.g. {'camera_1': 0.01, 'camera_3': 0.002}
+motion_gate_action = 'skip'       # 'skip' drops the frame, 'store' records a "no change" entry
+
+# Frame quality gate: dark, blurred/obscured and frozen frames skip the vision model
+# and are stored as a lightweight "skipped" record instead. Measured on a 320 px
+# greyscale thumbnail; per-camera overrides use the same keys, e.g.
+# {'camera_2': {'min_brightness': 10}} for a camera with a dim night view.
+enable_quality_gate = False
+quality_min_brightness = 20       # Mean luminance (0-255)
+quality_min_sharpness = 30        # Variance of the Laplacian
+quality_min_change = 0.5          # Mean absolute difference (0-255) to the previous sampled frame
+camera_quality_thresholds = {}
+
+# Person pre-detector: OpenCV's built-in HOG people detector routes sampled frames.
+# Frames with people get full analysis; frames without people are only analyzed
+# once every person_sparse_interval_seconds. The box count is stored as person_count
+# (-1 when the detector did not run).
+enable_person_detector = False
+person_detector_width = 640       # Frames are downscaled to this width before detection
+person_min_confidence = 0.5       # Minimum SVM score of a detection
+person_sparse_interval_seconds = 30
+
+# Near-duplicate frame suppression
+# Frames whose perceptual hash is within dedup_max_distance bits of the last
+# analyzed frame reuse that frame's analysis instead of calling the vision model.
+enable_frame_dedup = False
+dedup_hash_method = 'dhash'       # 'dhash' or 'phash'
+dedup_max_distance = 5            # Hamming distance (out of 64 bits)
+
+# Fused analysis: one vision model call returning both objects and description
+# (halves image-encoder prefill); falls back to two calls if the JSON can't be parsed
+enable_fused_analysis = False
+
+# Concurrent LLM requests
+# With async inference the object and description calls for a frame are issued
+# together. llm_max_concurrency bounds the requests in flight across the whole
+# process; match it to OLLAMA_NUM_PARALLEL on the Ollama server.
+enable_async_inference = False
+llm_max_concurrency = 2
+
+# Number of video frames analyzed concurrently by analyze_video (1 = one at a time)
+frame_concurrency = 1
+
+# Persistent LLM result cache, keyed by image, prompt, system message and model
+enable_inference_cache = True
+inference_cache_file = "./inference_cache.sqlite3"
+inference_cache_max_bytes = 256 * 1024 * 1024   # Least recently used entries are evicted above this size
+
+# Vector store write batching: documents are embedded and inserted in batches
+# once vector_write_batch_size are buffered or the oldest has waited
+# vector_write_flush_seconds (1 = insert every document immediately)
+vector_write_batch_size = 32
+vector_write_flush_seconds = 10
+
+# Multi-process ingestion of the local camera folders (1 = one file at a time)
+# Each worker process decodes and analyzes whole files; the main process is the
+# only writer to the vector store, the processing ledger and the CSV log.
+# Note that llm_max_concurrency applies per worker process.
+ingestion_workers = 1
 
 # Google Drive API configuration (optional)
 # To enable Google Drive API integration:
@@ -329,19 +472,66 @@ def analyze_cctv_directory_structure(directory):
     print()
 
 
-def get_jpeg_files(directory):
-    """Get all JPEG image files from directory and subdirectories recursively"""
-    file_extensions = ['jpg', 'jpeg', 'JPG', 'JPEG']
-    all_files = []
-    
-    print(f"{Fore.CYAN}Scanning for image files in: {directory}{Style.RESET_ALL}")
-    
-    for ext in file_extensions:
-        pattern = os.path.join(directory, '**', f'*.{ext}')
-        files_for_ext = glob.glob(pattern, recursive=True)
-        all_files.extend(files_for_ext)
-        if files_for_ext:
-            print(f"  Found {len(files_for_ext)} .{ext} files")
+image_file_extensions = ('.jpg', '.jpeg')
+video_file_extensions = ('.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm')
+
+def get_media_type(file_path):
+    """'image', 'video' or None, from the file extension"""
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension in image_file_extensions:
+        return 'image'
+    if extension in video_file_extensions:
+        return 'video'
+    return None
+
+def iter_media_files(directory):
+    """Yield (path, media_type, stat) for every image and video under directory
+
+    A single iterative os.scandir pass classifies entries by lowercase
+    extension, so each directory is read once and case variants such as
+    .jpg/.JPG are never counted twice. Results stream out directory by
+    directory (in name order) while the walk is still running. Like the
+    glob patterns this replaces, hidden files and directories are skipped.
+    Symlinked directories are not followed.
+    """
+    pending_dirs = [directory]
+    while pending_dirs:
+        current_dir = pending_dirs.pop()
+        try:
+            with os.scandir(current_dir) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError as e:
+            print(f"{Fore.YELLOW}Warning: Could not scan {current_dir}: {str(e)}{Style.RESET_ALL}")
+            continue
+
+        subdirs = []
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                    continue
+                media_type = get_media_type(entry.name)
+                if media_type and entry.is_file():
+                    yield entry.path, media_type, entry.stat()
+            except OSError:
+                # Removed while scanning
+                continue
+        # Reversed so the stack visits subdirectories in name order
+        pending_dirs.extend(reversed(subdirs))
+
+def _print_extension_counts(files):
+    extension_counts = {}
+    for file_path in files:
+        extension = os.path.splitext(file_path)[1]
+        extension_counts[extension] = extension_counts.get(extension, 0) + 1
+    for extension, count in extension_counts.items():
+        print(f"  Found {count} {extension} files")
+
+def print_image_file_summary(directory, all_files):
+    """Print the image counts per extension and per directory"""
+    _print_extension_counts(all_files)
     
     if all_files:
         print(f"{Fore.GREEN}Total image files found: {len(all_files)}{Style.RESET_ALL}")
@@ -361,23 +551,10 @@ def get_jpeg_files(directory):
                 print(f"  📁 Root directory: {count} files")
             else:
                 print(f"  📁 {dir_name}: {count} files")
-    
-    return all_files
 
-def get_video_files(directory):
-    """Get all video files from directory and subdirectories recursively
-    Perfect for CCTV setups with multiple camera folders"""
-    file_extensions = ['mp4', 'avi', 'mov', 'mkv', 'wmv', 'flv', 'webm']
-    all_files = []
-    
-    print(f"{Fore.CYAN}Scanning for video files in: {directory}{Style.RESET_ALL}")
-    
-    for ext in file_extensions:
-        pattern = os.path.join(directory, '**', f'*.{ext}')
-        files_for_ext = glob.glob(pattern, recursive=True)
-        all_files.extend(files_for_ext)
-        if files_for_ext:
-            print(f"  Found {len(files_for_ext)} .{ext} files")
+def print_video_file_summary(directory, all_files):
+    """Print the video counts per extension and per camera folder, with a few example files"""
+    _print_extension_counts(all_files)
     
     # Group files by subdirectory for CCTV camera organization
     if all_files:
@@ -403,53 +580,650 @@ def get_video_files(directory):
                     print(f"    📹 {filename}")
                 if len(files) > 3:
                     print(f"    ... and {len(files) - 3} more files")
-    
-    return all_files
 
-def extract_frames_from_video(video_path, interval_seconds=2):
-    """Extract frames from video at specified interval (default 10 seconds)"""
+def iter_pending_media_files(directory, found_files):
+    """Yield (media_type, path) for the images and videos under directory that still need processing
+
+    Files stream out of iter_media_files as the walk runs, so processing can
+    start before it ends. Every file found is appended to
+    found_files['image'] / found_files['video'], and those the processed-file
+    index marks as done to found_files['skipped'], for the end-of-run summary.
+    """
+    processed_index = get_processed_file_index()
+    for file_path, media_type, _ in iter_media_files(directory):
+        found_files[media_type].append(file_path)
+        if media_type == 'image':
+            processed = processed_index.is_processed(file_path)
+        else:
+            processed = processed_index.is_processed(file_path, interval_seconds=video_interval_seconds)
+        if processed:
+            found_files['skipped'].append(file_path)
+        else:
+            yield media_type, file_path
+
+def _scaled_size(width, height, max_dimension):
+    """(width, height) shrunk so the longest side is at most max_dimension (0 = unchanged)"""
+    if not max_dimension or max(width, height) <= max_dimension:
+        return width, height
+    scale = max_dimension / max(width, height)
+    # Even sizes keep every decoder / pixel format happy
+    return max(2, int(width * scale) // 2 * 2), max(2, int(height * scale) // 2 * 2)
+
+class FrameRecord(dict):
+    """Frame dict used by the analysis pipeline
+
+    Only the decoded BGR array is stored; the PIL 'image' entry is created
+    the first time something asks for it, since the encoder works on the
+    BGR buffer directly.
+    """
+    def __missing__(self, key):
+        if key != 'image':
+            raise KeyError(key)
+        # Convert BGR to RGB (OpenCV uses BGR, PIL uses RGB)
+        pil_image = Image.fromarray(cv2.cvtColor(self['bgr'], cv2.COLOR_BGR2RGB))
+        self['image'] = pil_image
+        return pil_image
+
+def _build_frame_record(frame, frame_count, fps):
+    """Wrap a decoded BGR frame into the frame dict used by the analysis pipeline"""
+    width, height = _scaled_size(frame.shape[1], frame.shape[0], decoder_max_dimension)
+    if (width, height) != (frame.shape[1], frame.shape[0]):
+        frame = cv2.resize(frame, (width, height), interpolation=cv2.INTER_AREA)
+
+    timestamp = frame_count / fps
+    print(f"Extracted frame at {timestamp:.2f} seconds")
+    return FrameRecord(bgr=frame, timestamp=timestamp, frame_number=frame_count)
+
+def get_video_properties(video_path):
+    """Read fps, frame count and dimensions of a video without decoding any frames"""
+    cap = cv2.VideoCapture(video_path)
+    try:
+        if not cap.isOpened():
+            return None
+        return {
+            'fps': cap.get(cv2.CAP_PROP_FPS),
+            'frame_count': int(cap.get(cv2.CAP_PROP_FRAME_COUNT)),
+            'width': int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            'height': int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        }
+    finally:
+        cap.release()
+
+def _iter_frames_opencv(video_path, interval_seconds, sampling_mode=None, start_frame=0, skip_frames=None):
+    """OpenCV implementation of iter_frames_from_video"""
+    skip_frames = skip_frames or set()
+    if sampling_mode is None:
+        sampling_mode = frame_sampling_mode
+
     cap = cv2.VideoCapture(video_path)
     
     if not cap.isOpened():
         print(f"Error: Could not open video file {video_path}")
-        return []
-    
-    fps = cap.get(cv2.CAP_PROP_FPS)
-    frame_interval = int(fps * interval_seconds)
+        return
     
+    try:
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        if not fps or fps <= 0:
+            print(f"Error: Could not determine FPS for video file {video_path}")
+            return
+
+        frame_interval = max(1, int(fps * interval_seconds))
+        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        # Start at the first sampled frame at or after start_frame
+        frame_count = -(-start_frame // frame_interval) * frame_interval
+        if frame_count > 0:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_count)
+
+        print(f"Video FPS: {fps}, extracting every {frame_interval} frames ({interval_seconds} seconds, mode: {sampling_mode})")
+
+        if sampling_mode == 'seek' and total_frames > 0:
+            # Only the sampled frames are decoded (plus the GOP lead-in the decoder needs)
+            for frame_count in range(frame_count, total_frames, frame_interval):
+                if frame_count in skip_frames:
+                    continue
+                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_count)
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                yield _build_frame_record(frame, frame_count, fps)
+        elif sampling_mode == 'read':
+            while True:
+                ret, frame = cap.read()
+                if not ret:
+                    break
+
+                if frame_count % frame_interval == 0 and frame_count not in skip_frames:
+                    yield _build_frame_record(frame, frame_count, fps)
+
+                frame_count += 1
+        else:
+            # grab() advances the stream without converting the frame into a numpy
+            # array, retrieve() is only paid for the frames we actually keep
+            while cap.grab():
+                if frame_count % frame_interval == 0 and frame_count not in skip_frames:
+                    ret, frame = cap.retrieve()
+                    if ret:
+                        yield _build_frame_record(frame, frame_count, fps)
+
+                frame_count += 1
+    finally:
+        cap.release()
+
+class VideoDecodeError(Exception):
+    """A decoder backend failed part way through a video"""
+
+class FrameDecoder:
+    """Base class for video decoder backends
+
+    iter_frames yields the same frame dicts for every backend: the sampled
+    frame numbers are multiples of int(fps * interval_seconds), starting at
+    the first one at or after start_frame and leaving out skip_frames.
+    """
+    name = ''
+
+    @staticmethod
+    def is_available() -> bool:
+        return True
+
+    def iter_frames(self, video_path, interval_seconds, start_frame=0, skip_frames=None, sampling_mode=None):
+        raise NotImplementedError
+
+class OpenCVDecoder(FrameDecoder):
+    name = 'opencv'
+
+    def iter_frames(self, video_path, interval_seconds, start_frame=0, skip_frames=None, sampling_mode=None):
+        return _iter_frames_opencv(video_path, interval_seconds, sampling_mode, start_frame, skip_frames)
+
+class FFmpegDecoder(FrameDecoder):
+    """Decimates (and optionally downscales) inside ffmpeg and streams raw BGR frames over a pipe"""
+    name = 'ffmpeg'
+
+    @staticmethod
+    def is_available() -> bool:
+        return shutil.which(ffmpeg_binary) is not None
+
+    def iter_frames(self, video_path, interval_seconds, start_frame=0, skip_frames=None, sampling_mode=None):
+        skip_frames = skip_frames or set()
+        properties = get_video_properties(video_path)
+        if not properties or properties['fps'] <= 0 or properties['width'] <= 0:
+            print(f"Error: Could not open video file {video_path}")
+            return
+
+        fps = properties['fps']
+        frame_interval = max(1, int(fps * interval_seconds))
+        first_frame = -(-start_frame // frame_interval) * frame_interval
+        width, height = _scaled_size(properties['width'], properties['height'], decoder_max_dimension)
+
+        # select keeps every frame_interval-th decoded frame, counted from the seek point
+        filters = [f"select='not(mod(n\\,{frame_interval}))'"]
+        if (width, height) != (properties['width'], properties['height']):
+            filters.append(f"scale={width}:{height}")
+        command = [ffmpeg_binary, '-v', 'error', '-nostdin']
+        if first_frame > 0:
+            command += ['-ss', f"{first_frame / fps:.6f}"]
+        command += ['-i', video_path, '-vf', ','.join(filters), '-vsync', '0',
+                    '-f', 'rawvideo', '-pix_fmt', 'bgr24', 'pipe:1']
+
+        print(f"Video FPS: {fps}, extracting every {frame_interval} frames ({interval_seconds} seconds, decoder: ffmpeg)")
+
+        frame_size = width * height * 3
+        # stderr goes to a file so a chatty ffmpeg can never block on a full pipe
+        with tempfile.TemporaryFile() as error_output:
+            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=error_output, bufsize=frame_size)
+            try:
+                frame_number = first_frame
+                while True:
+                    data = process.stdout.read(frame_size)
+                    if len(data) < frame_size:
+                        break
+                    if frame_number not in skip_frames:
+                        frame = np.frombuffer(data, dtype=np.uint8).reshape(height, width, 3)
+                        yield _build_frame_record(frame, frame_number, fps)
+                    frame_number += frame_interval
+            finally:
+                if process.poll() is None:
+                    process.kill()
+                process.stdout.close()
+                process.wait()
+
+            # Only reached when the output ran out, not when the consumer stopped early
+            if process.returncode != 0:
+                error_output.seek(0)
+                message = error_output.read().decode(errors='replace').strip()
+                raise VideoDecodeError(f"ffmpeg exited with code {process.returncode} on {video_path}: {message}")
+
+class PyAVDecoder(FrameDecoder):
+    """In-process libav decoding through the optional 'av' package"""
+    name = 'pyav'
+
+    @staticmethod
+    def is_available() -> bool:
+        return importlib.util.find_spec('av') is not None
+
+    def iter_frames(self, video_path, interval_seconds, start_frame=0, skip_frames=None, sampling_mode=None):
+        import av
+
+        skip_frames = skip_frames or set()
+        try:
+            container = av.open(video_path)
+        except Exception as e:
+            print(f"Error: Could not open video file {video_path}: {str(e)}")
+            return
+
+        with container:
+            stream = container.streams.video[0]
+            stream.thread_type = 'AUTO'
+            fps = float(stream.average_rate or 0)
+            if fps <= 0:
+                print(f"Error: Could not determine FPS for video file {video_path}")
+                return
+
+            frame_interval = max(1, int(fps * interval_seconds))
+            first_frame = -(-start_frame // frame_interval) * frame_interval
+            width, height = _scaled_size(stream.codec_context.width, stream.codec_context.height, decoder_max_dimension)
+            start_pts = stream.start_time or 0
+
+            print(f"Video FPS: {fps}, extracting every {frame_interval} frames ({interval_seconds} seconds, decoder: pyav)")
+
+            if first_frame > 0:
+                # Seeks to the keyframe before the target; frames before it are dropped below
+                container.seek(int(first_frame / fps / stream.time_base) + start_pts, stream=stream)
+
+            for frame in container.decode(stream):
+                frame_number = int(round((frame.pts - start_pts) * stream.time_base * fps))
+                if frame_number < first_frame or frame_number % frame_interval != 0 or frame_number in skip_frames:
+                    continue
+                bgr = frame.to_ndarray(format='bgr24', width=width, height=height)
+                # Apply the display rotation (counter-clockwise degrees) like the ffmpeg and OpenCV backends do
+                rotation = getattr(frame, 'rotation', 0)
+                if rotation % 360:
+                    bgr = np.ascontiguousarray(np.rot90(bgr, rotation // 90))
+                yield _build_frame_record(bgr, frame_number, fps)
+
+decoder_classes = {'ffmpeg': FFmpegDecoder, 'pyav': PyAVDecoder, 'opencv': OpenCVDecoder}
+
+def get_decoder(backend=None) -> FrameDecoder:
+    """Decoder for the configured backend, falling back to OpenCV when it is not available"""
+    backend = backend or decoder_backend
+    decoder_class = decoder_classes.get(backend, OpenCVDecoder)
+    if not decoder_class.is_available():
+        print(f"{Fore.YELLOW}Decoder backend '{backend}' is not available, using OpenCV{Style.RESET_ALL}")
+        decoder_class = OpenCVDecoder
+    return decoder_class()
+
+def iter_frames_from_video(video_path, interval_seconds=2, sampling_mode=None, start_frame=0, skip_frames=None, backend=None):
+    """Lazily yield frames from video at specified interval (default 2 seconds)
+
+    Frames are decoded one at a time as the consumer asks for them, so memory
+    use stays flat regardless of the length of the clip.
+
+    Args:
+        video_path: Local path of the video file
+        interval_seconds: Interval between extracted frames
+        sampling_mode: 'read', 'grab' or 'seek' for the OpenCV backend (defaults to frame_sampling_mode)
+        start_frame: Skip sampled frames before this frame number (used to resume)
+        skip_frames: Set of frame numbers that are not retrieved (already analyzed)
+        backend: Decoder backend (defaults to decoder_backend)
+    """
+    return get_decoder(backend).iter_frames(video_path, interval_seconds, start_frame, skip_frames, sampling_mode)
+
+def _decode_segment(video_path, frame_numbers, sampling_mode):
+    """Decode the given sampled frame numbers (ascending) in a decode worker process"""
+    cap = cv2.VideoCapture(video_path)
     frames = []
-    frame_count = 0
-    
-    print(f"Video FPS: {fps}, extracting every {frame_interval} frames ({interval_seconds} seconds)")
-    
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            break
-            
-        if frame_count % frame_interval == 0:
-            # Convert BGR to RGB (OpenCV uses BGR, PIL uses RGB)
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            pil_image = Image.fromarray(frame_rgb)
-            
-            timestamp = frame_count / fps
-            frames.append({
-                'image': pil_image,
-                'timestamp': timestamp,
-                'frame_number': frame_count
-            })
-            print(f"Extracted frame at {timestamp:.2f} seconds")
-        
-        frame_count += 1
-    
-    cap.release()
+    try:
+        if not cap.isOpened():
+            return frames
+        frame_count = frame_numbers[0]
+        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_count)
+        for frame_number in frame_numbers:
+            if sampling_mode == 'seek' and frame_number != frame_count:
+                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+                frame_count = frame_number
+            # Walk forward from the segment start to the next sampled frame
+            while frame_count < frame_number:
+                if not cap.grab():
+                    return frames
+                frame_count += 1
+            ret, frame = cap.read()
+            if not ret:
+                return frames
+            frame_count += 1
+            frames.append((frame_number, frame))
+    finally:
+        cap.release()
     return frames
 
-def convert_frame_to_base64(pil_image)->str:
-    """Convert PIL image to base64 string for video frames"""
+def iter_frames_parallel_segments(video_path, interval_seconds=2, workers=2, sampling_mode=None, start_frame=0, skip_frames=None):
+    """Like iter_frames_from_video, but decodes time segments in parallel processes
+
+    The sampled frame numbers are split into short segments; each decode
+    process seeks to its segment start and decodes only that range. Segments
+    are yielded back in timestamp order, with at most two segments per
+    worker in flight so memory stays bounded.
+    """
+    if sampling_mode is None:
+        sampling_mode = frame_sampling_mode
+    skip_frames = skip_frames or set()
+
+    properties = get_video_properties(video_path)
+    if not properties or properties['fps'] <= 0 or properties['frame_count'] <= 0:
+        # Unknown length: fall back to a single sequential decoder
+        yield from iter_frames_from_video(video_path, interval_seconds, sampling_mode, start_frame, skip_frames)
+        return
+
+    fps = properties['fps']
+    frame_interval = max(1, int(fps * interval_seconds))
+    first_frame = -(-start_frame // frame_interval) * frame_interval
+    frame_numbers = [n for n in range(first_frame, properties['frame_count'], frame_interval) if n not in skip_frames]
+    segments = [frame_numbers[i:i + decode_segment_frames] for i in range(0, len(frame_numbers), decode_segment_frames)]
+
+    print(f"Video FPS: {fps}, extracting every {frame_interval} frames ({interval_seconds} seconds), "
+          f"{len(segments)} segments across {workers} decode processes")
+
+    executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+    try:
+        pending = deque()
+        next_segment = 0
+        while next_segment < len(segments) or pending:
+            while next_segment < len(segments) and len(pending) < workers * 2:
+                pending.append(executor.submit(_decode_segment, video_path, segments[next_segment], sampling_mode))
+                next_segment += 1
+            for frame_number, frame in pending.popleft().result():
+                yield _build_frame_record(frame, frame_number, fps)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+def get_camera_name(video_file):
+    """Camera name for a video, i.e. the folder it lives in (see CCTV layout above)"""
+    folder_path = os.path.dirname(video_file)
+    return os.path.basename(folder_path) if folder_path != root_image_dir else "Root"
+
+def _downscale_gray(bgr_frame, width=320, blur=True):
+    """Small (by default blurred) grayscale copy of a frame for cheap vectorized scoring"""
+    height = max(1, int(bgr_frame.shape[0] * width / bgr_frame.shape[1]))
+    small = cv2.resize(bgr_frame, (width, height), interpolation=cv2.INTER_AREA)
+    gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+    return cv2.GaussianBlur(gray, (5, 5), 0) if blur else gray
+
+class FrameQualityGate:
+    """Flags sampled frames that are too dark, too blurred or frozen to be worth analyzing"""
+
+    def __init__(self, min_brightness, min_sharpness, min_change):
+        self.min_brightness = min_brightness
+        self.min_sharpness = min_sharpness
+        self.min_change = min_change
+        self.previous_gray = None
+
+    def check(self, bgr_frame):
+        """Return (skip_reason or None, metrics); the first frame is never 'frozen'"""
+        gray = _downscale_gray(bgr_frame, blur=False)
+        metrics = {
+            'brightness': float(gray.mean()),
+            'sharpness': float(cv2.Laplacian(gray, cv2.CV_64F).var()),
+            'change': None
+        }
+        if self.previous_gray is not None and self.previous_gray.shape == gray.shape:
+            metrics['change'] = float(cv2.absdiff(gray, self.previous_gray).mean())
+        self.previous_gray = gray
+
+        if metrics['brightness'] < self.min_brightness:
+            return 'too_dark', metrics
+        if metrics['sharpness'] < self.min_sharpness:
+            return 'blurred', metrics
+        if metrics['change'] is not None and metrics['change'] < self.min_change:
+            return 'frozen', metrics
+        return None, metrics
+
+def create_quality_gate(video_file):
+    """Create a FrameQualityGate using the thresholds configured for the video's camera"""
+    overrides = camera_quality_thresholds.get(get_camera_name(video_file), {})
+    return FrameQualityGate(
+        overrides.get('min_brightness', quality_min_brightness),
+        overrides.get('min_sharpness', quality_min_sharpness),
+        overrides.get('min_change', quality_min_change))
+
+class PersonDetector:
+    """Counts people in a frame with OpenCV's default HOG + linear SVM people detector"""
+
+    def __init__(self, width=640, min_confidence=0.5):
+        self.width = width
+        self.min_confidence = min_confidence
+        self.hog = cv2.HOGDescriptor()
+        self.hog.setSVMDetector(cv2.HOGDescriptor_getDefaultPeopleDetector())
+        self.frames_checked = 0
+        self.total_seconds = 0.0
+
+    def count(self, bgr_frame) -> int:
+        """Number of person boxes scoring at least min_confidence"""
+        start_time = time.time()
+        if bgr_frame.shape[1] > self.width:
+            height = max(1, int(bgr_frame.shape[0] * self.width / bgr_frame.shape[1]))
+            bgr_frame = cv2.resize(bgr_frame, (self.width, height), interpolation=cv2.INTER_AREA)
+        boxes, weights = self.hog.detectMultiScale(bgr_frame, winStride=(8, 8), padding=(8, 8), scale=1.05)
+        person_count = int(np.count_nonzero(np.asarray(weights).ravel() >= self.min_confidence)) if len(boxes) else 0
+        self.frames_checked += 1
+        self.total_seconds += time.time() - start_time
+        return person_count
+
+def create_person_detector():
+    """Create the PersonDetector, or None if this OpenCV build has no HOG detector (e.g. OpenCV 5 without contrib)"""
+    if not hasattr(cv2, 'HOGDescriptor'):
+        print(f"{Fore.YELLOW}Person detector unavailable in OpenCV {cv2.__version__} (no HOGDescriptor), "
+              f"analyzing all frames{Style.RESET_ALL}")
+        return None
+    return PersonDetector(person_detector_width, person_min_confidence)
+
+quality_skip_descriptions = {
+    'too_dark': "Frame too dark to analyze (mean luminance {brightness:.1f})",
+    'blurred': "Frame blurred or camera obscured (sharpness {sharpness:.1f})",
+    'frozen': "Frozen frame, unchanged from the previous sample (difference {change:.2f})"
+}
+
+# camera -> {skip_reason: count}, reported at the end of a run
+quality_skip_counts = {}
+_quality_skip_lock = threading.Lock()
+
+def count_quality_skip(camera, skip_reason):
+    """Record a quality-gate skip for the per-camera report"""
+    if _csv_row_queue is not None:
+        # Ingestion worker: the main process keeps the totals
+        _csv_row_queue.put(('quality_skip', camera, skip_reason))
+        return
+    with _quality_skip_lock:
+        camera_counts = quality_skip_counts.setdefault(camera, {})
+        camera_counts[skip_reason] = camera_counts.get(skip_reason, 0) + 1
+
+def print_quality_skip_summary():
+    """Per-camera counts of frames skipped by the quality gate"""
+    if not quality_skip_counts:
+        return
+    print(f"{Fore.CYAN}🌙 Frames skipped by quality gate:{Style.RESET_ALL}")
+    for camera, camera_counts in sorted(quality_skip_counts.items()):
+        details = ', '.join(f"{reason.replace('_', ' ')}: {count}" for reason, count in sorted(camera_counts.items()))
+        print(f"  📹 {camera}: {sum(camera_counts.values())} ({details})")
+
+class MotionGate:
+    """Decides whether a sampled frame shows enough change to be worth analyzing"""
+
+    def __init__(self, threshold, method='mog2'):
+        self.threshold = threshold
+        self.method = method
+        self.previous_gray = None
+        self.frames_seen = 0
+        if method == 'mog2':
+            self.subtractor = cv2.createBackgroundSubtractorMOG2(history=50, varThreshold=16, detectShadows=False)
+        else:
+            self.subtractor = None
+
+    def score(self, bgr_frame) -> float:
+        """Fraction of pixels that changed compared to the scene model (0.0 - 1.0)"""
+        gray = _downscale_gray(bgr_frame)
+        if self.subtractor is not None:
+            mask = self.subtractor.apply(gray)
+            motion_score = float(np.count_nonzero(mask) / mask.size)
+        elif self.previous_gray is None:
+            motion_score = 1.0
+        else:
+            diff = cv2.absdiff(gray, self.previous_gray)
+            motion_score = float(np.count_nonzero(diff > 25) / diff.size)
+        self.previous_gray = gray
+        return motion_score
+
+    def check(self, bgr_frame):
+        """Return (should_analyze, motion_score); the first frame is always analyzed"""
+        motion_score = self.score(bgr_frame)
+        self.frames_seen += 1
+        if self.frames_seen == 1:
+            return True, motion_score
+        return motion_score >= self.threshold, motion_score
+
+def create_motion_gate(video_file):
+    """Create a MotionGate using the threshold configured for the video's camera"""
+    threshold = camera_motion_thresholds.get(get_camera_name(video_file), motion_threshold)
+    return MotionGate(threshold, motion_gate_method)
+
+def compute_frame_hash(bgr_frame, method='dhash') -> int:
+    """64-bit perceptual hash of a frame ('dhash' gradient hash or 'phash' DCT hash)"""
+    gray = cv2.cvtColor(bgr_frame, cv2.COLOR_BGR2GRAY)
+    if method == 'phash':
+        small = cv2.resize(gray, (32, 32), interpolation=cv2.INTER_AREA).astype(np.float32)
+        low_freq = cv2.dct(small)[:8, :8]
+        bits = low_freq > np.median(low_freq)
+    else:
+        small = cv2.resize(gray, (9, 8), interpolation=cv2.INTER_AREA)
+        bits = small[:, 1:] > small[:, :-1]
+    return int.from_bytes(np.packbits(bits.flatten()).tobytes(), 'big')
+
+def hamming_distance(hash_a, hash_b) -> int:
+    return bin(hash_a ^ hash_b).count('1')
+
+class FrameDeduplicator:
+    """Remembers the last analyzed frame so near-identical frames can reuse its analysis"""
+
+    def __init__(self, max_distance=5, method='dhash'):
+        self.max_distance = max_distance
+        self.method = method
+        self.last_hash = None
+        self.last_source = None
+
+    def find_duplicate(self, frame_hash):
+        """Return whatever was remembered for the last analyzed frame if frame_hash is a near-duplicate"""
+        if self.last_hash is None or self.last_source is None:
+            return None
+        if hamming_distance(frame_hash, self.last_hash) <= self.max_distance:
+            return self.last_source
+        return None
+
+    def remember(self, frame_hash, source):
+        """Record the last analyzed frame (its details, or the scheduler entry that will hold them)"""
+        self.last_hash = frame_hash
+        self.last_source = source
+
+def fit_image_for_model(pil_image):
+    """Downscale a PIL image so its longest side fits max_image_dimension
+
+    JPEG files that have not been loaded yet are decoded at reduced
+    resolution (Pillow draft mode), so a 24 MP photo is never fully decoded.
+    """
+    if max_image_dimension and max(pil_image.size) > max_image_dimension:
+        if pil_image.format == 'JPEG':
+            pil_image.draft('RGB', (max_image_dimension, max_image_dimension))
+        scale = max_image_dimension / max(pil_image.size)
+        size = (max(1, round(pil_image.size[0] * scale)), max(1, round(pil_image.size[1] * scale)))
+        pil_image = pil_image.resize(size, Image.LANCZOS)
+    if pil_image.mode not in ('RGB', 'L'):
+        pil_image = pil_image.convert('RGB')
+    return pil_image
+
+def encode_image_for_model(pil_image)->str:
+    """Resize and JPEG-encode a PIL image, returning the base64 payload sent to the model"""
+    pil_image = fit_image_for_model(pil_image)
     buffered = BytesIO()
-    pil_image.save(buffered, format="JPEG")
+    pil_image.save(buffered, format="JPEG", quality=jpeg_quality)
     img_str = base64.b64encode(buffered.getvalue()).decode("utf-8")
+    print(f'PAYLOAD: {len(img_str) / 1024:.1f} KB ({pil_image.size[0]}x{pil_image.size[1]})')
+    return img_str
+
+def _encode_bgr(bgr, max_dimension, quality):
+    """Resize and JPEG/base64-encode a BGR frame; returns (payload, width, height)"""
+    width, height = _scaled_size(bgr.shape[1], bgr.shape[0], max_dimension)
+    if (width, height) != (bgr.shape[1], bgr.shape[0]):
+        bgr = cv2.resize(bgr, (width, height), interpolation=cv2.INTER_AREA)
+    ok, encoded = cv2.imencode('.jpg', bgr, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    if not ok:
+        raise ValueError("Could not JPEG-encode video frame")
+    return base64.b64encode(encoded).decode("utf-8"), width, height
+
+_attached_segments = {}
+
+def _encode_shared_frame(shm_name, shape, max_dimension, quality):
+    """Encode a frame that encode_frame_for_model placed in shared memory (runs in an encode worker)
+
+    Segments are reused for every frame, so each worker attaches to a segment once.
+    """
+    shm = _attached_segments.get(shm_name)
+    if shm is None:
+        shm = _attached_segments[shm_name] = shared_memory.SharedMemory(name=shm_name)
+    return _encode_bgr(np.ndarray(shape, dtype=np.uint8, buffer=shm.buf), max_dimension, quality)
+
+_encode_pool = None
+_encode_segments = None
+_encode_pool_lock = threading.Lock()
+
+def get_encode_pool():
+    """Process pool for frame encoding, created on first use
+
+    Frames travel through a fixed set of shared memory segments, two per
+    worker, that are created at the first frame's size and reused; a frame
+    waits for a free segment.
+    """
+    global _encode_pool, _encode_segments
+    with _encode_pool_lock:
+        if _encode_pool is None:
+            _encode_pool = ProcessPoolExecutor(max_workers=encode_workers, mp_context=multiprocessing.get_context('spawn'))
+            _encode_segments = queue.Queue()
+            for _ in range(encode_workers * 2):
+                _encode_segments.put(None)
+            atexit.register(_shutdown_encode_pool)
+        return _encode_pool
+
+def _shutdown_encode_pool():
+    _encode_pool.shutdown()
+    while not _encode_segments.empty():
+        shm = _encode_segments.get()
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+def encode_frame_for_model(bgr)->str:
+    """Resize and JPEG-encode a decoded BGR frame with OpenCV, returning the base64 payload
+
+    Skips the RGB conversion and PIL image entirely; the encoded buffer is
+    handed to base64 without an intermediate bytes copy. With encode_workers
+    set, the frame is copied once into a shared memory segment and encoded in
+    the encode process pool.
+    """
+    if encode_workers > 0:
+        bgr = np.ascontiguousarray(bgr, dtype=np.uint8)
+        pool = get_encode_pool()
+        shm = _encode_segments.get()
+        try:
+            if shm is None or shm.size < bgr.nbytes:
+                # First use, or a larger frame than the segment was made for
+                if shm is not None:
+                    shm.close()
+                    shm.unlink()
+                    shm = None
+                shm = shared_memory.SharedMemory(create=True, size=bgr.nbytes)
+            np.ndarray(bgr.shape, dtype=np.uint8, buffer=shm.buf)[:] = bgr
+            future = pool.submit(_encode_shared_frame, shm.name, bgr.shape, max_image_dimension, jpeg_quality)
+            img_str, width, height = future.result()
+        finally:
+            _encode_segments.put(shm)
+    else:
+        img_str, width, height = _encode_bgr(bgr, max_image_dimension, jpeg_quality)
+    print(f'PAYLOAD: {len(img_str) / 1024:.1f} KB ({width}x{height})')
     return img_str
 
 def is_url(string):
@@ -640,6 +1414,8 @@ def process_google_drive_folder(folder_url, vision_chain, object_chain, interval
             if frame_details_list:
                 total_objects = sum(len(frame.detected_objects) for frame in frame_details_list)
                 print(f"{Fore.GREEN}✅ Video {i}: {len(frame_details_list)} frames, {total_objects} objects{Style.RESET_ALL}")
+            elif get_processed_file_index().is_processed(file_url, interval_seconds=interval_seconds):
+                print(f"{Fore.GREEN}✅ Video {i}: nothing new to analyze, all sampled frames already stored{Style.RESET_ALL}")
             else:
                 print(f"{Fore.YELLOW}⚠️  Video {i}: No frames extracted{Style.RESET_ALL}")
                 
@@ -815,28 +1591,187 @@ def download_video_from_url(url, temp_dir=None):
         return None
 
 def convert_to_base64(pil_image)->str:
-    buffered = BytesIO()
-    pil_image.save(buffered, format="JPEG")
-    img_str = base64.b64encode(buffered.getvalue()).decode("utf-8")
+    return encode_image_for_model(pil_image)
+
+def can_pass_through_jpeg(pil_image)->bool:
+    """True if an opened (not yet decoded) image can be sent as its original JPEG bytes"""
+    return (enable_jpeg_passthrough
+            and pil_image.format == 'JPEG'
+            and pil_image.mode in ('RGB', 'L')
+            and (not max_image_dimension or max(pil_image.size) <= max_image_dimension))
+
+def convert_image_file_to_base64(image_file, pil_image)->str:
+    """Base64 payload for a photo; JPEG files within the size limit are passed through unchanged
+
+    Only the file header has been parsed by Image.open at this point, so a
+    passed-through JPEG is never decoded or re-encoded.
+    """
+    if not can_pass_through_jpeg(pil_image):
+        return convert_to_base64(pil_image)
+    with open(image_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        img_str = base64.b64encode(mapped).decode("utf-8")
+    print(f'PAYLOAD: {len(img_str) / 1024:.1f} KB ({pil_image.size[0]}x{pil_image.size[1]}, original JPEG)')
     return img_str
 
-def get_processed_files():
-    with closing(sqlite3.connect(f"./{db_name}/chroma.sqlite3")) as connection:
-        sql = "select string_value from embedding_metadata where key='file_name'"
-        rows = connection.execute(sql).fetchall()
-        processed_files = [file_name for file_name, in rows]
-    return processed_files
-
-def get_processed_video_frames():
-    """Get list of processed video frames to avoid reprocessing"""
-    with closing(sqlite3.connect(f"./{db_name}/chroma.sqlite3")) as connection:
-        sql = "select string_value from embedding_metadata where key='content_type' and string_value='video_frame'"
-        rows = connection.execute(sql).fetchall()
-        # Also get the file names for these video frames
-        sql2 = "select string_value from embedding_metadata where key='file_name'"
-        file_rows = connection.execute(sql2).fetchall()
-        processed_files = [file_name for file_name, in file_rows]
-    return processed_files
+def _get_file_signature(file_path):
+    """(size, mtime) of a local file, or (None, None) for URLs / missing files"""
+    try:
+        stat = os.stat(file_path)
+        return stat.st_size, stat.st_mtime
+    except OSError:
+        return None, None
+
+class ProcessedFileIndex:
+    """Persistent processing ledger with O(1) "already done?" lookups
+
+    Lives next to the Chroma store and records, per file, its status
+    ('in_progress' or 'done'), the last frame whose results are safely in the
+    vector store, the frame interval used and the file's size/mtime. Videos
+    that were interrupted resume after their last checkpoint, and files that
+    changed on disk are processed again.
+
+    On first use it is seeded from Chroma: images are seeded as done, videos
+    as in progress without an interval. Those are not resumed; their next run
+    skips the frames already stored instead.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self.connection.execute(
+            "create table if not exists processed_files ("
+            "file_name text primary key, content_type text, file_size integer, file_mtime real, processed_at text, "
+            "status text, last_frame_number integer, interval_seconds real)")
+        self.connection.commit()
+        if self.connection.execute("select count(*) from processed_files").fetchone()[0] == 0:
+            self._seed_from_chroma()
+
+    def _seed_from_chroma(self):
+        chroma_file = f"./{db_name}/chroma.sqlite3"
+        if not os.path.exists(chroma_file):
+            return
+        try:
+            with closing(sqlite3.connect(chroma_file)) as connection:
+                sql = ("select f.string_value, c.string_value, max(n.int_value) from embedding_metadata f "
+                       "left join embedding_metadata c on c.id = f.id and c.key = 'content_type' "
+                       "left join embedding_metadata n on n.id = f.id and n.key = 'frame_number' "
+                       "where f.key = 'file_name' group by f.string_value, c.string_value")
+                rows = connection.execute(sql).fetchall()
+        except sqlite3.Error:
+            return
+        processed_at = datetime.now().isoformat()
+        seed_rows = []
+        for file_name, content_type, last_frame_number in rows:
+            if content_type == 'video_frame':
+                seed_rows.append((file_name, 'video', processed_at, 'in_progress', last_frame_number))
+            else:
+                seed_rows.append((file_name, 'image', processed_at, 'done', None))
+        self.connection.executemany(
+            "insert or ignore into processed_files (file_name, content_type, processed_at, status, last_frame_number) "
+            "values (?, ?, ?, ?, ?)", seed_rows)
+        self.connection.commit()
+        if rows:
+            print(f"Seeded processed-file index with {len(rows)} entries from {db_name}")
+
+    def _get_entry(self, file_path):
+        with self.lock:
+            return self.connection.execute(
+                "select file_size, file_mtime, status, last_frame_number, interval_seconds "
+                "from processed_files where file_name = ?", (file_path,)).fetchone()
+
+    @staticmethod
+    def _unchanged(file_path, file_size, file_mtime) -> bool:
+        # Rows seeded from Chroma have no signature and are trusted
+        return file_size is None or (file_size, file_mtime) == _get_file_signature(file_path)
+
+    def is_unchanged(self, file_path) -> bool:
+        """True if the file is in the ledger and its size/mtime still match the recorded ones"""
+        row = self._get_entry(file_path)
+        return row is not None and self._unchanged(file_path, row[0], row[1])
+
+    def is_processed(self, file_path, interval_seconds=None) -> bool:
+        """True if the file is done; for videos, done at interval_seconds when one is given"""
+        row = self._get_entry(file_path)
+        if row is None:
+            return False
+        file_size, file_mtime, status, _, previous_interval = row
+        # A video row without an interval (seeded from Chroma) is not done at any particular interval
+        if interval_seconds is not None and previous_interval != interval_seconds:
+            return False
+        return status == 'done' and self._unchanged(file_path, file_size, file_mtime)
+
+    def get_resume_frame(self, file_path, interval_seconds):
+        """Last checkpointed frame of an interrupted run with the same interval, or None"""
+        row = self._get_entry(file_path)
+        if row is None:
+            return None
+        file_size, file_mtime, status, last_frame_number, previous_interval = row
+        if status != 'in_progress' or last_frame_number is None:
+            return None
+        if not self._unchanged(file_path, file_size, file_mtime):
+            return None
+        # Rows seeded from Chroma have no interval; their stored frames are skipped instead
+        if previous_interval != interval_seconds:
+            return None
+        return last_frame_number
+
+    def mark_in_progress(self, file_path, content_type, interval_seconds=None, last_frame_number=None):
+        file_size, file_mtime = _get_file_signature(file_path)
+        with self.lock:
+            self.connection.execute(
+                "insert or replace into processed_files (file_name, content_type, file_size, file_mtime, processed_at, "
+                "status, last_frame_number, interval_seconds) values (?, ?, ?, ?, ?, 'in_progress', ?, ?)",
+                (file_path, content_type, file_size, file_mtime, datetime.now().isoformat(),
+                 last_frame_number, interval_seconds))
+            self.connection.commit()
+
+    def checkpoint(self, file_path, frame_number):
+        """Record that all sampled frames up to frame_number are in the vector store"""
+        with self.lock:
+            self.connection.execute(
+                "update processed_files set last_frame_number = max(coalesce(last_frame_number, -1), ?), "
+                "processed_at = ? where file_name = ?",
+                (frame_number, datetime.now().isoformat(), file_path))
+            self.connection.commit()
+
+    def mark_processed(self, file_path, content_type, interval_seconds=None):
+        file_size, file_mtime = _get_file_signature(file_path)
+        with self.lock:
+            self.connection.execute(
+                "insert or replace into processed_files (file_name, content_type, file_size, file_mtime, processed_at, "
+                "status, last_frame_number, interval_seconds) values (?, ?, ?, ?, ?, 'done', "
+                "(select last_frame_number from processed_files where file_name = ?), ?)",
+                (file_path, content_type, file_size, file_mtime, datetime.now().isoformat(),
+                 file_path, interval_seconds))
+            self.connection.commit()
+
+_processed_file_index = None
+_processed_file_index_lock = threading.Lock()
+
+def get_processed_file_index():
+    global _processed_file_index
+    with _processed_file_index_lock:
+        if _processed_file_index is None:
+            os.makedirs(f"./{db_name}", exist_ok=True)
+            _processed_file_index = ProcessedFileIndex(f"./{db_name}/processed_files.sqlite3")
+        return _processed_file_index
+
+def get_stored_frame_numbers(video_file, model):
+    """Frame numbers of a video already analyzed by model in the vector store (any interval)
+
+    Gate records ('frame_gate') and results from other models don't count.
+    """
+    chroma_file = f"./{db_name}/chroma.sqlite3"
+    if not os.path.exists(chroma_file):
+        return set()
+    with closing(sqlite3.connect(chroma_file)) as connection:
+        sql = ("select n.int_value from embedding_metadata f "
+               "join embedding_metadata n on n.id = f.id and n.key = 'frame_number' "
+               "join embedding_metadata g on g.id = f.id and g.key = 'generated_with' "
+               "where f.key = 'file_name' and f.string_value = ? and g.string_value = ?")
+        rows = connection.execute(sql, (video_file, model)).fetchall()
+    return {frame_number for frame_number, in rows if frame_number is not None}
 
 def setup_csv_logging():
     """Create CSV output directory and return session-specific filename"""
@@ -853,34 +1788,26 @@ def setup_csv_logging():
     
     # Create CSV file with headers
     with open(csv_filepath, 'w', newline='', encoding='utf-8') as csvfile:
-        fieldnames = [
-            'session_timestamp', 'file_path', 'content_type', 'timestamp_seconds', 
-            'frame_number', 'object_name', 'object_description', 'scene_description',
-            'make', 'model', 'camera_date', 'aperture_value', 'focal_length', 
-            'exposure_time', 'f_stops', 'iso', 'gps_coordinates', 'generated_with',
-            'processing_time_seconds'
-        ]
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer = csv.DictWriter(csvfile, fieldnames=csv_fieldnames)
         writer.writeheader()
     
     print(f"{Fore.GREEN}CSV logging enabled: {csv_filepath}{Style.RESET_ALL}")
     return csv_filepath
 
+_csv_row_queue = None  # Set in ingestion worker processes; rows are written by the main process
+
 def log_to_csv(csv_filepath, data):
     """Log detection data to CSV file"""
     if not csv_filepath or not enable_csv_logging:
         return
     
+    if _csv_row_queue is not None:
+        _csv_row_queue.put(('csv', csv_filepath, data))
+        return
+    
     try:
         with open(csv_filepath, 'a', newline='', encoding='utf-8') as csvfile:
-            fieldnames = [
-                'session_timestamp', 'file_path', 'content_type', 'timestamp_seconds', 
-                'frame_number', 'object_name', 'object_description', 'scene_description',
-                'make', 'model', 'camera_date', 'aperture_value', 'focal_length', 
-                'exposure_time', 'f_stops', 'iso', 'gps_coordinates', 'generated_with',
-                'processing_time_seconds'
-            ]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer = csv.DictWriter(csvfile, fieldnames=csv_fieldnames)
             writer.writerow(data)
     except Exception as e:
         print(f"{Fore.YELLOW}Warning: Could not write to CSV: {str(e)}{Style.RESET_ALL}")
@@ -914,7 +1841,8 @@ def log_image_to_csv(csv_filepath, image_details, processing_time):
                 'iso': image_details.iso,
                 'gps_coordinates': image_details.gps,
                 'generated_with': image_details.generated_with,
-                'processing_time_seconds': f"{processing_time:.4f}"
+                'processing_time_seconds': f"{processing_time:.4f}",
+                'deduplicated': ''
             }
             log_to_csv(csv_filepath, log_data)
     else:
@@ -938,7 +1866,8 @@ def log_image_to_csv(csv_filepath, image_details, processing_time):
             'iso': image_details.iso,
             'gps_coordinates': image_details.gps,
             'generated_with': image_details.generated_with,
-            'processing_time_seconds': f"{processing_time:.4f}"
+            'processing_time_seconds': f"{processing_time:.4f}",
+            'deduplicated': ''
         }
         log_to_csv(csv_filepath, log_data)
 
@@ -971,7 +1900,8 @@ def log_video_frame_to_csv(csv_filepath, frame_details, processing_time):
                 'iso': '',
                 'gps_coordinates': '',
                 'generated_with': frame_details.generated_with,
-                'processing_time_seconds': f"{processing_time:.4f}"
+                'processing_time_seconds': f"{processing_time:.4f}",
+                'deduplicated': str(frame_details.deduplicated)
             }
             log_to_csv(csv_filepath, log_data)
     else:
@@ -982,7 +1912,7 @@ def log_video_frame_to_csv(csv_filepath, frame_details, processing_time):
             'content_type': 'video_frame',
             'timestamp_seconds': f"{frame_details.timestamp:.2f}",
             'frame_number': str(frame_details.frame_number),
-            'object_name': 'NO_OBJECTS_DETECTED',
+            'object_name': f"SKIPPED_{frame_details.skip_reason.upper()}" if frame_details.skip_reason else 'NO_OBJECTS_DETECTED',
             'object_description': '',
             'scene_description': frame_details.description,
             'make': '',
@@ -995,7 +1925,8 @@ def log_video_frame_to_csv(csv_filepath, frame_details, processing_time):
             'iso': '',
             'gps_coordinates': '',
             'generated_with': frame_details.generated_with,
-            'processing_time_seconds': f"{processing_time:.4f}"
+            'processing_time_seconds': f"{processing_time:.4f}",
+            'deduplicated': str(frame_details.deduplicated)
         }
         log_to_csv(csv_filepath, log_data)
 
@@ -1024,6 +1955,31 @@ You should always output your results in json format, for example:
 '''
     return system_message_text
 
+def get_fused_system_message()->str:
+    system_message_text = '''
+You're an expert image and photo analyzer.
+You are very perceptive in analyzing images and photos. 
+You possess excelent vision. 
+Do not read any text unless it is the most prominent in the image. 
+Your description should be neutral in tone.
+You should always output your results as a single json object, for example:
+
+{
+ "objects": [
+  {"name": "a detected object", "description": "the detected object's description"},
+  {"name": "another detected object", "description": "the other detected object's description"}
+ ],
+ "description": "a detailed description of the whole image"
+}
+'''
+    return system_message_text
+
+def get_fused_prompt(description_prompt)->str:
+    return ("Identify the objects in the image and describe it. "
+            "Return a single json object with exactly two fields: 'objects', a list of json items "
+            "each with the 'name' and a short 'description' of one detected object, and 'description', a string. "
+            f"For the 'description' field: {description_prompt}")
+
 def prompt_func(data):
     text = data["text"]
     image = data["image"]
@@ -1040,6 +1996,352 @@ def prompt_func(data):
     return [system_message, human_message]
 
 
+def normalize_file_name(file_name) -> str:
+    """Path spelling used for document ids: URLs as-is, local paths with '/' separators and no './' prefixes"""
+    if is_url(file_name):
+        return file_name
+    return posixpath.normpath(file_name.replace('\\', '/'))
+
+def make_document_id(file_name, frame_number=None, model=None) -> str:
+    """Deterministic document id for an image (frame_number None) or video frame
+
+    Re-processing the same file/frame produces the same id, so the vector
+    store upserts instead of accumulating duplicates. Image ids include the
+    model. Video frame ids do not: a frame position holds a single record,
+    whether it was analyzed or skipped by a frame gate, and by whichever
+    model ran last.
+    """
+    if frame_number is None:
+        key = f"{normalize_file_name(file_name)}|image|{model}"
+    else:
+        key = f"{normalize_file_name(file_name)}|frame_{frame_number}"
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, key))
+
+class VectorStoreWriteBuffer:
+    """Collects Documents and writes them to the vector store in batches
+
+    A flush embeds the whole batch with one embed_documents call and inserts
+    it in a single Chroma transaction. Buffers are flushed when full, when the
+    oldest document has waited flush_seconds, and at interpreter exit.
+    """
+
+    def __init__(self, batch_size, flush_seconds):
+        self.batch_size = max(1, batch_size)
+        self.flush_seconds = flush_seconds
+        self.documents = []
+        self.callbacks = []
+        self.oldest_time = None
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self.timer_thread = None
+        self.documents_written = 0
+        self.batches_written = 0
+
+    def add(self, doc, on_stored=None):
+        """Buffer a document; on_stored() is called once it has been written"""
+        with self.lock:
+            self.documents.append(doc)
+            if on_stored is not None:
+                self.callbacks.append(on_stored)
+            if self.oldest_time is None:
+                self.oldest_time = time.time()
+            should_flush = len(self.documents) >= self.batch_size
+            self._start_timer()
+        if should_flush:
+            self.flush()
+
+    def add_callback(self, on_stored):
+        """Call on_stored() once every document buffered so far has been written"""
+        with self.lock:
+            self.callbacks.append(on_stored)
+            if self.oldest_time is None:
+                self.oldest_time = time.time()
+            self._start_timer()
+
+    def _start_timer(self):
+        if self.timer_thread is None and self.flush_seconds:
+            self.timer_thread = threading.Thread(target=self._flush_periodically, daemon=True)
+            self.timer_thread.start()
+
+    def flush(self):
+        with self.flush_lock:
+            with self.lock:
+                documents, callbacks = self.documents, self.callbacks
+                self.documents, self.callbacks, self.oldest_time = [], [], None
+            if not documents and not callbacks:
+                return
+            try:
+                if documents:
+                    # Ids are deterministic, so keep only the latest document per id in a batch
+                    db.add_documents(list({doc.id: doc for doc in documents}.values()))
+            except Exception:
+                # Put the batch back so a later flush can retry it
+                with self.lock:
+                    self.documents = documents + self.documents
+                    self.callbacks = callbacks + self.callbacks
+                    self.oldest_time = time.time()
+                raise
+            if documents:
+                self.documents_written += len(documents)
+                self.batches_written += 1
+        for callback in callbacks:
+            callback()
+
+    def _flush_periodically(self):
+        while True:
+            time.sleep(self.flush_seconds)
+            with self.lock:
+                stale = self.oldest_time is not None and time.time() - self.oldest_time >= self.flush_seconds
+            if stale:
+                try:
+                    self.flush()
+                except Exception as e:
+                    print(f"{Fore.YELLOW}Warning: Could not write to vector store: {str(e)}{Style.RESET_ALL}")
+
+_vector_write_buffer = None
+_vector_write_buffer_lock = threading.Lock()
+
+def get_vector_write_buffer():
+    global _vector_write_buffer
+    with _vector_write_buffer_lock:
+        if _vector_write_buffer is None:
+            _vector_write_buffer = VectorStoreWriteBuffer(vector_write_batch_size, vector_write_flush_seconds)
+            atexit.register(_vector_write_buffer.flush)
+        return _vector_write_buffer
+
+def store_document(doc, on_stored=None):
+    """Queue a document for the vector store"""
+    get_vector_write_buffer().add(doc, on_stored)
+
+def flush_vector_store():
+    """Write any buffered documents to the vector store now"""
+    if _vector_write_buffer is not None:
+        _vector_write_buffer.flush()
+
+def _parse_fused_result(result):
+    """Validate the fused json output and split it into (detected_objects, description)"""
+    if not isinstance(result, dict):
+        raise ValueError(f"Expected a json object, got {type(result).__name__}")
+    objects = result.get('objects')
+    description = result.get('description')
+    if not isinstance(objects, list) or not isinstance(description, str):
+        raise ValueError("Fused result is missing 'objects' or 'description'")
+    detected_objects = [
+        {'name': str(item.get('name', '')), 'description': str(item.get('description', ''))}
+        for item in objects if isinstance(item, dict)
+    ]
+    return detected_objects, description
+
+class InferenceCache:
+    """Content-addressed SQLite cache of parsed LLM results with LRU eviction"""
+
+    def __init__(self, path, max_bytes):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self.connection.execute(
+            "create table if not exists llm_cache ("
+            "key text primary key, value text not null, size integer not null, last_access real not null)")
+        self.connection.execute("create index if not exists llm_cache_last_access on llm_cache(last_access)")
+        self.connection.commit()
+        self.total_bytes = self.connection.execute("select coalesce(sum(size), 0) from llm_cache").fetchone()[0]
+
+    @staticmethod
+    def make_key(image_b64, text, system_message_text, model) -> str:
+        digest = hashlib.sha256()
+        for part in (model, system_message_text, text, image_b64):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def get(self, key):
+        with self.lock:
+            row = self.connection.execute("select value from llm_cache where key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.connection.execute("update llm_cache set last_access = ? where key = ?", (time.time(), key))
+            self.connection.commit()
+        return json.loads(row[0])
+
+    def put(self, key, value):
+        value_text = json.dumps(value)
+        size = len(key) + len(value_text)
+        with self.lock:
+            row = self.connection.execute("select size from llm_cache where key = ?", (key,)).fetchone()
+            if row is not None:
+                self.total_bytes -= row[0]
+            self.connection.execute(
+                "insert or replace into llm_cache (key, value, size, last_access) values (?, ?, ?, ?)",
+                (key, value_text, size, time.time()))
+            self.total_bytes += size
+            self._evict()
+            self.connection.commit()
+
+    def _evict(self):
+        if self.total_bytes <= self.max_bytes:
+            return
+        evicted = []
+        for key, size in self.connection.execute("select key, size from llm_cache order by last_access"):
+            if self.total_bytes <= self.max_bytes:
+                break
+            evicted.append((key,))
+            self.total_bytes -= size
+        self.connection.executemany("delete from llm_cache where key = ?", evicted)
+
+    def print_stats(self):
+        total = self.hits + self.misses
+        hit_rate = (self.hits / total * 100) if total else 0.0
+        print(f"{Fore.CYAN}Inference cache: {self.hits} hits, {self.misses} misses ({hit_rate:.1f}% hit rate), "
+              f"{self.total_bytes / (1024 * 1024):.1f} MB in {self.path}{Style.RESET_ALL}")
+
+_inference_cache = None
+_inference_cache_lock = threading.Lock()
+
+def get_inference_cache():
+    """Open the inference cache on first use; stats are reported when the interpreter exits"""
+    global _inference_cache
+    if not enable_inference_cache:
+        return None
+    with _inference_cache_lock:
+        if _inference_cache is None:
+            _inference_cache = InferenceCache(inference_cache_file, inference_cache_max_bytes)
+            atexit.register(_inference_cache.print_stats)
+        return _inference_cache
+
+def _get_chain_model(chain) -> str:
+    try:
+        return chain.steps[1].model
+    except (AttributeError, IndexError):
+        return vision_model
+
+def _cache_key(chain, payload):
+    return InferenceCache.make_key(payload["image"], payload["text"], payload["system_message_text"], _get_chain_model(chain))
+
+_llm_request_slots = None
+_llm_request_slots_lock = threading.Lock()
+
+def get_llm_request_slots():
+    """Process-wide semaphore limiting concurrent requests to the Ollama server"""
+    global _llm_request_slots
+    with _llm_request_slots_lock:
+        if _llm_request_slots is None:
+            _llm_request_slots = threading.BoundedSemaphore(max(1, llm_max_concurrency))
+        return _llm_request_slots
+
+_llm_event_loop = None
+_llm_event_loop_lock = threading.Lock()
+
+def get_llm_event_loop():
+    """Event loop for the async LLM calls, running forever on a background thread
+
+    The chains' async HTTP clients stay bound to the loop they were first used
+    on, so every frame (from any analysis thread) must go through this one loop
+    instead of a fresh asyncio.run() loop per call.
+    """
+    global _llm_event_loop
+    with _llm_event_loop_lock:
+        if _llm_event_loop is None:
+            _llm_event_loop = asyncio.new_event_loop()
+            threading.Thread(target=_llm_event_loop.run_forever, name='llm-event-loop', daemon=True).start()
+        return _llm_event_loop
+
+def _invoke_bounded(chain, payload, validate=None):
+    """Invoke chain under the request limit, through the inference cache
+
+    If validate is given the result is only cached when validate(result)
+    does not raise; its exception is passed on to the caller.
+    """
+    cache = get_inference_cache()
+    if cache:
+        key = _cache_key(chain, payload)
+        cached = cache.get(key)
+        if cached is not None:
+            print('(CACHED)')
+            return cached
+
+    with get_llm_request_slots():
+        result = chain.invoke(payload)
+
+    if validate:
+        validate(result)
+    if cache:
+        cache.put(key, result)
+    return result
+
+async def _ainvoke_bounded(chain, payload):
+    cache = get_inference_cache()
+    if cache:
+        key = _cache_key(chain, payload)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    slots = get_llm_request_slots()
+    # Wait without blocking the loop or tying up its executor threads, which
+    # the chains need for their sync steps (a blocked acquire there can deadlock)
+    while not slots.acquire(blocking=False):
+        await asyncio.sleep(0.05)
+    try:
+        result = await chain.ainvoke(payload)
+    finally:
+        slots.release()
+
+    if cache:
+        cache.put(key, result)
+    return result
+
+async def adetect_and_describe(image_b64, vision_chain, object_chain, object_prompt, description_prompt):
+    """Issue the object detection and description requests concurrently"""
+    return await asyncio.gather(
+        _ainvoke_bounded(object_chain, {"text": object_prompt, "image": image_b64, "system_message_text": get_object_system_message()}),
+        _ainvoke_bounded(vision_chain, {"text": description_prompt, "image": image_b64, "system_message_text": get_vision_system_message()})
+    )
+
+def detect_and_describe(image_b64, vision_chain, object_chain, object_prompt, description_prompt):
+    """Run object detection and description for one base64 image
+
+    Returns (detected_objects, description). In fused mode a single call
+    produces both; any failure to get valid fused json falls back to the
+    separate object_chain / vision_chain calls, which run concurrently when
+    enable_async_inference is set.
+    """
+    if enable_fused_analysis:
+        print('DETECTING OBJECTS AND GENERATING DESCRIPTION (FUSED)...')
+        try:
+            result = _invoke_bounded(object_chain, {
+                "text": get_fused_prompt(description_prompt),
+                "image": image_b64,
+                "system_message_text": get_fused_system_message()
+            }, validate=_parse_fused_result)
+            detected_objects, description = _parse_fused_result(result)
+            print('OK')
+            return detected_objects, description
+        except Exception as e:
+            print(f"{Fore.YELLOW}Fused analysis failed ({str(e)}), falling back to separate calls{Style.RESET_ALL}")
+
+    if enable_async_inference:
+        print('DETECTING OBJECTS AND GENERATING DESCRIPTION (CONCURRENT)...')
+        detected_objects, description = asyncio.run_coroutine_threadsafe(
+            adetect_and_describe(image_b64, vision_chain, object_chain, object_prompt, description_prompt),
+            get_llm_event_loop()).result()
+        print('OK')
+        return detected_objects, description
+
+    print('DETECTING OBJECTS...')
+    detected_objects = _invoke_bounded(object_chain, {"text": object_prompt, "image": image_b64, "system_message_text": get_object_system_message()})
+    print('OK')
+
+    print('GENERATING DESCRIPTION...')
+    description = _invoke_bounded(vision_chain, {"text": description_prompt, "image": image_b64, "system_message_text": get_vision_system_message()})
+    print('OK')
+
+    return detected_objects, description
+
 def analyze_image(image_file, vision_chain, object_chain, csv_filepath=None)->ImageDetails:
     start_time = time.time()
     model = vision_chain.steps[1].model
@@ -1047,24 +2349,27 @@ def analyze_image(image_file, vision_chain, object_chain, csv_filepath=None)->Im
 
         print(f'PROCESSING FILE: {image_file}')
         print('CONVERTING TO B64...')
-        image_b64 = convert_to_base64(img)
-        print('OK')
-        
-        print('DETECTING OBJECTS...')
-        detected_objects = object_chain.invoke({"text":"Identify objects in the image. Return a json list of json items of the detected objects. Include only the names of each object and a short description of the object. The field names should be 'name' and 'description' respectively.", "image": image_b64, "system_message_text":get_object_system_message()})
+        image_b64 = convert_image_file_to_base64(image_file, img)
         print('OK')
         
-        print('GENERATING DESCRIPTION...')
-        image_description = vision_chain.invoke({"text": "Describe the image in as much detail as possible. Do not try to read any text.", "image": image_b64, "system_message_text":get_vision_system_message()})
-        print('OK')
+        detected_objects, image_description = detect_and_describe(
+            image_b64, vision_chain, object_chain,
+            "Identify objects in the image. Return a json list of json items of the detected objects. Include only the names of each object and a short description of the object. The field names should be 'name' and 'description' respectively.",
+            "Describe the image in as much detail as possible. Do not try to read any text."
+        )
 
         print('CREATING OBJECT...')
         image_details = ImageDetailsFactory.create(image_file, img, detected_objects, image_description, model)
         print('OK')
 
         print('ADDING TO VECTOR STORE...')
-        doc = Document(id=str(uuid.uuid4()), page_content=image_details.get_page_content(), metadata=image_details.to_dict())
-        db.add_documents([doc])
+        doc = Document(
+            id=make_document_id(image_file, None, image_details.generated_with),
+            page_content=image_details.get_page_content(),
+            metadata=image_details.to_dict()
+        )
+        # The image only counts as processed once its document is actually written
+        store_document(doc, on_stored=partial(get_processed_file_index().mark_processed, image_file, 'image'))
         print('OK')
 
         end_time = time.time()
@@ -1087,8 +2392,8 @@ def analyze_image(image_file, vision_chain, object_chain, csv_filepath=None)->Im
 
     return image_details
 
-def analyze_video_frame(video_file, frame_data, vision_chain, object_chain, csv_filepath=None)->VideoFrameDetails:
-    """Analyze a single frame from a video"""
+def analyze_video_frame(video_file, frame_data, vision_chain, object_chain, csv_filepath=None, on_stored=None)->VideoFrameDetails:
+    """Analyze a single frame from a video (on_stored runs once its document is written)"""
     start_time = time.time()
     model = vision_chain.steps[1].model
     
@@ -1097,24 +2402,14 @@ def analyze_video_frame(video_file, frame_data, vision_chain, object_chain, csv_
     print(f'TIMESTAMP: {frame_data["timestamp"]:.2f}s')
     
     print('CONVERTING FRAME TO B64...')
-    image_b64 = convert_frame_to_base64(frame_data['image'])
+    image_b64 = encode_frame_for_model(frame_data['bgr'])
     print('OK')
     
-    print('DETECTING OBJECTS IN FRAME...')
-    detected_objects = object_chain.invoke({
-        "text": "Identify objects in the video frame. Return a json list of json items of the detected objects. Include only the names of each object and a short description of the object. The field names should be 'name' and 'description' respectively.", 
-        "image": image_b64, 
-        "system_message_text": get_object_system_message()
-    })
-    print('OK')
-    
-    print('GENERATING FRAME DESCRIPTION...')
-    frame_description = vision_chain.invoke({
-        "text": "Describe this video frame in as much detail as possible. Focus on the main subjects, actions, and scene composition. Do not try to read any text.", 
-        "image": image_b64, 
-        "system_message_text": get_vision_system_message()
-    })
-    print('OK')
+    detected_objects, frame_description = detect_and_describe(
+        image_b64, vision_chain, object_chain,
+        "Identify objects in the video frame. Return a json list of json items of the detected objects. Include only the names of each object and a short description of the object. The field names should be 'name' and 'description' respectively.",
+        "Describe this video frame in as much detail as possible. Focus on the main subjects, actions, and scene composition. Do not try to read any text."
+    )
 
     print('CREATING VIDEO FRAME OBJECT...')
     frame_details = VideoFrameDetails(
@@ -1123,17 +2418,18 @@ def analyze_video_frame(video_file, frame_data, vision_chain, object_chain, csv_
         frame_data['frame_number'], 
         detected_objects, 
         frame_description, 
-        model
+        model,
+        person_count=frame_data.get('person_count', -1)
     )
     print('OK')
 
     print('ADDING TO VECTOR STORE...')
     doc = Document(
-        id=str(uuid.uuid4()), 
+        id=make_document_id(video_file, frame_details.frame_number), 
         page_content=frame_details.get_page_content(), 
         metadata=frame_details.to_dict()
     )
-    db.add_documents([doc])
+    store_document(doc, on_stored=on_stored)
     print('OK')
 
     end_time = time.time()
@@ -1154,16 +2450,88 @@ def analyze_video_frame(video_file, frame_data, vision_chain, object_chain, csv_
 
     return frame_details
 
-def analyze_video(video_file_or_url, vision_chain, object_chain, interval_seconds=2, csv_filepath=None):
+def record_skipped_video_frame(video_file, frame_data, skip_reason, description, csv_filepath=None)->VideoFrameDetails:
+    """Store a lightweight entry for a frame that was not sent to the vision model"""
+    frame_details = VideoFrameDetails(
+        video_file,
+        frame_data['timestamp'],
+        frame_data['frame_number'],
+        [],
+        description,
+        'frame_gate',
+        skip_reason,
+        person_count=frame_data.get('person_count', -1)
+    )
+
+    doc = Document(
+        id=make_document_id(video_file, frame_details.frame_number),
+        page_content=frame_details.get_page_content(),
+        metadata=frame_details.to_dict()
+    )
+    store_document(doc)
+
+    if csv_filepath:
+        log_video_frame_to_csv(csv_filepath, frame_details, 0.0)
+
+    return frame_details
+
+def reuse_video_frame_details(video_file, frame_data, source_details, csv_filepath=None)->VideoFrameDetails:
+    """Store a near-duplicate frame using the analysis of an earlier frame, with its own timestamp"""
+    start_time = time.time()
+    frame_details = VideoFrameDetails(
+        video_file,
+        frame_data['timestamp'],
+        frame_data['frame_number'],
+        source_details.detected_objects,
+        source_details.description,
+        source_details.generated_with,
+        deduplicated=True,
+        duplicate_of_frame=source_details.frame_number,
+        person_count=frame_data.get('person_count', -1)
+    )
+
+    doc = Document(
+        id=make_document_id(video_file, frame_details.frame_number),
+        page_content=frame_details.get_page_content(),
+        metadata=frame_details.to_dict()
+    )
+    store_document(doc)
+
+    if csv_filepath:
+        log_video_frame_to_csv(csv_filepath, frame_details, time.time() - start_time)
+
+    return frame_details
+
+def _timed_analyze_video_frame(video_file, frame_data, vision_chain, object_chain):
+    """Worker for the frame scheduler; CSV logging is done by the caller in frame order"""
+    start_time = time.time()
+    frame_details = analyze_video_frame(video_file, frame_data, vision_chain, object_chain)
+    return frame_details, time.time() - start_time
+
+def _frame_position(frame_data):
+    """Timestamp/frame number only, so queued entries don't pin decoded frames in memory"""
+    return {'timestamp': frame_data['timestamp'], 'frame_number': frame_data['frame_number'],
+            'person_count': frame_data.get('person_count', -1)}
+
+def analyze_video(video_file_or_url, vision_chain, object_chain, interval_seconds=2, csv_filepath=None, max_in_flight=None):
     """Analyze an entire video by extracting frames at specified intervals
     
+    Up to max_in_flight frames are analyzed concurrently (base64 encoding,
+    LLM inference, embedding and vector store insert) while the next frames
+    are being decoded. Results are collected, logged and returned in frame order.
+    
     Args:
         video_file_or_url: Local file path or URL (including Google Drive links)
         vision_chain: Vision processing chain
         object_chain: Object detection processing chain
         interval_seconds: Interval between frame extractions
         csv_filepath: Path to CSV file for logging
+        max_in_flight: Frames analyzed concurrently (defaults to frame_concurrency)
     """
+    if max_in_flight is None:
+        max_in_flight = frame_concurrency
+    max_in_flight = max(1, max_in_flight)
+
     temp_file = None
     local_video_path = video_file_or_url
     
@@ -1184,20 +2552,180 @@ def analyze_video(video_file_or_url, vision_chain, object_chain, interval_second
         print(f"{Fore.GREEN}PROCESSING VIDEO: {video_file_or_url}{Style.RESET_ALL}")
         print(f"Extracting frames every {interval_seconds} seconds...")
         
-        frames = extract_frames_from_video(local_video_path, interval_seconds)
+        # Estimate the number of sampled frames for progress output only;
+        # frames themselves are streamed one at a time from the decoder
+        expected_frames = '?'
+        properties = get_video_properties(local_video_path)
+        if properties and properties['fps'] > 0 and properties['frame_count'] > 0:
+            frame_interval = max(1, int(properties['fps'] * interval_seconds))
+            expected_frames = (properties['frame_count'] + frame_interval - 1) // frame_interval
         
-        if not frames:
-            print(f"{Fore.RED}No frames extracted from video{Style.RESET_ALL}")
-            return []
+        motion_gate = create_motion_gate(video_file_or_url) if enable_motion_gate else None
+        if motion_gate:
+            print(f"Motion gate enabled ({motion_gate.method}, threshold {motion_gate.threshold})")
+        
+        quality_gate = create_quality_gate(video_file_or_url) if enable_quality_gate else None
+        camera_name = get_camera_name(video_file_or_url)
+        
+        person_detector = create_person_detector() if enable_person_detector else None
+        last_sparse_timestamp = None
+        
+        deduplicator = FrameDeduplicator(dedup_max_distance, dedup_hash_method) if enable_frame_dedup else None
+        
+        ledger = get_processed_file_index()
+        start_frame = 0
+        resume_frame = ledger.get_resume_frame(video_file_or_url, interval_seconds)
+        if resume_frame is not None:
+            start_frame = resume_frame + 1
+            print(f"{Fore.CYAN}Resuming after checkpointed frame {resume_frame}{Style.RESET_ALL}")
+        # Stored frames are only valid for the clip they were taken from; a DVR
+        # may overwrite a file under the same name (checked before mark_in_progress
+        # records the new signature)
+        file_unchanged = ledger.is_unchanged(video_file_or_url)
+        ledger.mark_in_progress(video_file_or_url, 'video', interval_seconds, resume_frame)
+        
+        # Frames already analyzed (e.g. at another interval) are not decoded or analyzed again
+        stored_frames = set()
+        if file_unchanged:
+            stored_frames = get_stored_frame_numbers(video_file_or_url, _get_chain_model(vision_chain))
+        if stored_frames:
+            print(f"{Fore.CYAN}{len(stored_frames)} frames of this video are already in the database and will be reused{Style.RESET_ALL}")
+        write_buffer = get_vector_write_buffer()
         
-        print(f"Extracted {len(frames)} frames from video")
+        if max_in_flight > 1:
+            print(f"Analyzing up to {max_in_flight} frames concurrently")
         
         frame_details_list = []
-        for i, frame_data in enumerate(frames):
-            print(f"\n--- Processing frame {i+1}/{len(frames)} ---")
-            # Use original URL/filename for metadata, not temp file path
-            frame_details = analyze_video_frame(video_file_or_url, frame_data, vision_chain, object_chain, csv_filepath)
+        frames_seen = 0
+        frames_without_motion = 0
+        frames_deduplicated = 0
+        frames_low_quality = {}
+        frames_without_people = 0
+        
+        # Scheduler entries are kept in frame order; 'analyze' entries hold a
+        # future, the others are resolved in the main thread when their turn comes
+        pending = deque()
+        in_flight = 0
+        
+        def resolve_next():
+            nonlocal in_flight
+            entry = pending.popleft()
+            if entry['kind'] == 'analyze':
+                in_flight -= 1
+                frame_details, execution_time = entry['future'].result()
+                if csv_filepath:
+                    log_video_frame_to_csv(csv_filepath, frame_details, execution_time)
+            elif entry['kind'] == 'duplicate':
+                frame_details = reuse_video_frame_details(
+                    video_file_or_url, entry['frame'], entry['source']['result'], csv_filepath)
+            else:
+                frame_details = record_skipped_video_frame(
+                    video_file_or_url, entry['frame'], entry['skip_reason'], entry['description'], csv_filepath)
+            entry['result'] = frame_details
             frame_details_list.append(frame_details)
+            # Entries resolve in frame order, so once the documents buffered so far
+            # are written, every sampled frame up to this one is safely stored
+            write_buffer.add_callback(partial(ledger.checkpoint, video_file_or_url, frame_details.frame_number))
+        
+        duration = properties['frame_count'] / properties['fps'] if properties and properties['fps'] > 0 else 0
+        if decode_workers > 1 and duration >= parallel_decode_min_seconds:
+            frame_source = iter_frames_parallel_segments(
+                local_video_path, interval_seconds, decode_workers, start_frame=start_frame, skip_frames=stored_frames)
+        else:
+            frame_source = iter_frames_from_video(local_video_path, interval_seconds, start_frame=start_frame, skip_frames=stored_frames)
+        
+        with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            for i, frame_data in enumerate(frame_source):
+                frames_seen += 1
+                print(f"\n--- Processing frame {i+1}/{expected_frames} ---")
+
+                if quality_gate:
+                    skip_reason, metrics = quality_gate.check(frame_data['bgr'])
+                    if skip_reason:
+                        frames_low_quality[skip_reason] = frames_low_quality.get(skip_reason, 0) + 1
+                        count_quality_skip(camera_name, skip_reason)
+                        print(f"{Fore.LIGHTYELLOW_EX}LOW QUALITY ({skip_reason.replace('_', ' ').upper()}), SKIPPED{Style.RESET_ALL}")
+                        pending.append({
+                            'kind': 'skipped',
+                            'frame': _frame_position(frame_data),
+                            'skip_reason': skip_reason,
+                            'description': quality_skip_descriptions[skip_reason].format(**metrics)
+                        })
+                        continue
+
+                if motion_gate:
+                    has_motion, motion_score = motion_gate.check(frame_data['bgr'])
+                    if not has_motion:
+                        frames_without_motion += 1
+                        print(f"{Fore.LIGHTYELLOW_EX}NO MOTION (score {motion_score:.4f}), SKIPPED{Style.RESET_ALL}")
+                        if motion_gate_action == 'store':
+                            pending.append({
+                                'kind': 'skipped',
+                                'frame': _frame_position(frame_data),
+                                'skip_reason': 'no_motion',
+                                'description': f"No change detected (motion score {motion_score:.4f})"
+                            })
+                        continue
+
+                if person_detector:
+                    frame_data['person_count'] = person_detector.count(frame_data['bgr'])
+                    if frame_data['person_count'] == 0:
+                        # No people: only keep one frame per sparse interval
+                        if last_sparse_timestamp is not None and frame_data['timestamp'] - last_sparse_timestamp < person_sparse_interval_seconds:
+                            frames_without_people += 1
+                            print(f"{Fore.LIGHTYELLOW_EX}NO PEOPLE DETECTED, SKIPPED (sparse schedule){Style.RESET_ALL}")
+                            continue
+                        last_sparse_timestamp = frame_data['timestamp']
+                    else:
+                        print(f"{Fore.CYAN}PEOPLE DETECTED: {frame_data['person_count']}{Style.RESET_ALL}")
+
+                if deduplicator:
+                    frame_hash = compute_frame_hash(frame_data['bgr'], deduplicator.method)
+                    source_entry = deduplicator.find_duplicate(frame_hash)
+                    if source_entry is not None:
+                        frames_deduplicated += 1
+                        print(f"{Fore.LIGHTYELLOW_EX}NEAR-DUPLICATE OF FRAME {source_entry['frame']['frame_number']}, REUSING ANALYSIS{Style.RESET_ALL}")
+                        pending.append({'kind': 'duplicate', 'frame': _frame_position(frame_data), 'source': source_entry})
+                        continue
+
+                # Use original URL/filename for metadata, not temp file path
+                entry = {
+                    'kind': 'analyze',
+                    'frame': _frame_position(frame_data),
+                    'future': executor.submit(_timed_analyze_video_frame, video_file_or_url, frame_data, vision_chain, object_chain)
+                }
+                pending.append(entry)
+                in_flight += 1
+                if deduplicator:
+                    deduplicator.remember(frame_hash, entry)
+
+                # Bound the number of frames in flight; results are drained in order
+                while in_flight >= max_in_flight:
+                    resolve_next()
+
+            while pending:
+                resolve_next()
+        
+        flush_vector_store()
+        
+        if frames_seen == 0 and resume_frame is None and not stored_frames:
+            print(f"{Fore.RED}No frames extracted from video{Style.RESET_ALL}")
+            return []
+        
+        ledger.mark_processed(video_file_or_url, 'video', interval_seconds)
+        if frames_seen == 0:
+            print(f"{Fore.GREEN}Nothing new to analyze: every sampled frame is already in the vector store{Style.RESET_ALL}")
+        print(f"Processed {frames_seen} frames from video")
+        if quality_gate:
+            details = ', '.join(f"{reason.replace('_', ' ')}: {count}" for reason, count in sorted(frames_low_quality.items()))
+            print(f"Frames skipped by quality gate: {sum(frames_low_quality.values())}/{frames_seen}" + (f" ({details})" if details else ""))
+        if motion_gate:
+            print(f"Frames skipped by motion gate: {frames_without_motion}/{frames_seen}")
+        if person_detector and person_detector.frames_checked:
+            print(f"Frames without people skipped: {frames_without_people}/{frames_seen} "
+                  f"(detector: {person_detector.total_seconds / person_detector.frames_checked * 1000:.1f} ms/frame)")
+        if deduplicator:
+            print(f"Near-duplicate frames reused: {frames_deduplicated}/{frames_seen}")
         
         return frame_details_list
         
@@ -1214,6 +2742,509 @@ def analyze_video_from_url(url, vision_chain, object_chain, interval_seconds=2):
     """Convenience function specifically for URL inputs"""
     return analyze_video(url, vision_chain, object_chain, interval_seconds)
 
+class FrameRingBuffer:
+    """Fixed-size frame queue between the stream reader and the analysis threads
+
+    When it is full the oldest frame is dropped, so a slow model only ever
+    sees the most recent frames instead of an ever-growing backlog.
+    """
+
+    def __init__(self, capacity):
+        self.frames = deque(maxlen=capacity)
+        self.condition = threading.Condition()
+        self.closed = False
+        self.dropped = 0
+
+    def put(self, frame_data):
+        with self.condition:
+            if len(self.frames) == self.frames.maxlen:
+                self.dropped += 1
+            self.frames.append(frame_data)
+            self.condition.notify()
+
+    def get(self):
+        """Oldest buffered frame; blocks until one arrives, None once closed and empty"""
+        with self.condition:
+            self.condition.wait_for(lambda: self.frames or self.closed)
+            return self.frames.popleft() if self.frames else None
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+def strip_url_credentials(source):
+    """source with any user:password@ removed from its URL; local paths are returned unchanged"""
+    parts = urllib.parse.urlsplit(source)
+    if not parts.scheme or '@' not in parts.netloc:
+        return source
+    netloc = parts.hostname or ''
+    if ':' in netloc:
+        # IPv6 literal
+        netloc = f"[{netloc}]"
+    if parts.port is not None:
+        netloc += f":{parts.port}"
+    return urllib.parse.urlunsplit(parts._replace(netloc=netloc))
+
+def _read_stream(source, ring_buffer, interval_seconds, stop_event):
+    """Stream reader thread: drain the capture continuously, sample into the ring buffer
+
+    Every frame is grabbed so the capture's own buffer never goes stale, but
+    only sampled frames are retrieved. A local file is replayed at its
+    native frame rate to behave like a live camera.
+    """
+    replay = os.path.isfile(source)
+    display_name = strip_url_credentials(source)
+    cap = None
+    frame_number = 0
+    start_time = time.time()
+    next_sample = start_time
+    try:
+        while not stop_event.is_set():
+            if cap is None:
+                cap = cv2.VideoCapture(source)
+                if not cap.isOpened():
+                    print(f"{Fore.RED}Error: Could not open stream {display_name}{Style.RESET_ALL}")
+                    if replay or stop_event.wait(stream_reconnect_seconds):
+                        break
+                    cap = None
+                    continue
+                fps = cap.get(cv2.CAP_PROP_FPS)
+
+            if replay and fps > 0:
+                delay = start_time + frame_number / fps - time.time()
+                if delay > 0:
+                    time.sleep(delay)
+
+            if not cap.grab():
+                cap.release()
+                cap = None
+                if replay:
+                    print(f"{Fore.CYAN}End of replayed stream {display_name}{Style.RESET_ALL}")
+                    break
+                print(f"{Fore.YELLOW}Stream {display_name} stopped delivering frames, reconnecting in {stream_reconnect_seconds}s...{Style.RESET_ALL}")
+                if stop_event.wait(stream_reconnect_seconds):
+                    break
+                continue
+
+            capture_time = time.time()
+            if capture_time >= next_sample:
+                ret, frame = cap.retrieve()
+                if ret:
+                    ring_buffer.put(FrameRecord(bgr=frame, timestamp=capture_time - start_time,
+                                                frame_number=frame_number, capture_time=capture_time))
+                # Stay on the sampling grid, but don't try to catch up after a stall
+                next_sample = max(next_sample + interval_seconds, capture_time)
+            frame_number += 1
+    finally:
+        if cap is not None:
+            cap.release()
+        ring_buffer.close()
+
+def analyze_stream(source, vision_chain, object_chain, interval_seconds=None, csv_filepath=None, duration_seconds=None):
+    """Analyze a live stream (e.g. rtsp://...) or a local file replayed as one
+
+    Frames are analyzed by frame_concurrency threads as they arrive; frames
+    that arrive faster than the model can keep up with are dropped. Reports
+    the latency from capture to the document being written to the vector store.
+    """
+    if interval_seconds is None:
+        interval_seconds = stream_interval_seconds
+    # Each session is stored under its own name, since frame numbers restart at 0;
+    # credentials in the URL must not end up in the vector store or the CSV
+    display_name = strip_url_credentials(source)
+    session_name = f"{display_name}#{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    ring_buffer = FrameRingBuffer(stream_buffer_size)
+    stop_event = threading.Event()
+    latencies = []
+    csv_lock = threading.Lock()
+    frame_details_list = []
+
+    print(f"{Fore.CYAN}Analyzing stream {display_name} every {interval_seconds}s (buffer: {stream_buffer_size} frames, "
+          f"{frame_concurrency} analysis thread(s)){Style.RESET_ALL}")
+
+    def record_latency(capture_time):
+        latency = time.time() - capture_time
+        latencies.append(latency)
+        print(f"{Fore.YELLOW}Capture-to-store latency: {latency:.2f} seconds{Style.RESET_ALL}")
+
+    def analysis_worker():
+        while True:
+            frame_data = ring_buffer.get()
+            if frame_data is None:
+                return
+            try:
+                start_time = time.time()
+                frame_details = analyze_video_frame(session_name, frame_data, vision_chain, object_chain,
+                                                    on_stored=partial(record_latency, frame_data['capture_time']))
+                # Batching writes would add up to vector_write_flush_seconds of latency
+                flush_vector_store()
+                frame_details_list.append(frame_details)
+                if csv_filepath:
+                    with csv_lock:
+                        log_video_frame_to_csv(csv_filepath, frame_details, time.time() - start_time)
+            except Exception as e:
+                print(f"{Fore.RED}Error analyzing stream frame {frame_data['frame_number']}: {str(e)}{Style.RESET_ALL}")
+
+    reader = threading.Thread(target=_read_stream, args=(source, ring_buffer, interval_seconds, stop_event), daemon=True)
+    workers = [threading.Thread(target=analysis_worker, daemon=True) for _ in range(max(1, frame_concurrency))]
+    reader.start()
+    for worker in workers:
+        worker.start()
+
+    try:
+        reader.join(timeout=duration_seconds)
+    except KeyboardInterrupt:
+        print(f"\n{Fore.YELLOW}Stopping stream analysis...{Style.RESET_ALL}")
+    stop_event.set()
+    reader.join()
+    for worker in workers:
+        worker.join()
+    flush_vector_store()
+
+    print(f"\n{Fore.GREEN}Stream analysis finished: {len(frame_details_list)} frames analyzed, "
+          f"{ring_buffer.dropped} dropped to keep up{Style.RESET_ALL}")
+    if latencies:
+        ordered = sorted(latencies)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        print(f"Capture-to-store latency: mean {sum(ordered) / len(ordered):.2f}s, "
+              f"median {ordered[len(ordered) // 2]:.2f}s, p95 {p95:.2f}s, max {ordered[-1]:.2f}s")
+    return frame_details_list
+
+class FolderWatcher:
+    """Tracks new or changed media files under a directory until they are fully written
+
+    Files are reported by ready_files() once their size and mtime have not
+    changed for settle_seconds, so clips the DVR is still writing are left alone.
+    """
+
+    def __init__(self, root_dir, settle_seconds):
+        self.root_dir = root_dir
+        self.settle_seconds = settle_seconds
+        self.candidates = {}  # path -> ((size, mtime), time that signature was first seen)
+        self.known = {}       # path -> (size, mtime) when last reported
+        self.lock = threading.Lock()
+        self.observer = None
+
+    def add_candidate(self, file_path):
+        if get_media_type(file_path) is None:
+            return
+        # Spell paths the way the batch scan does (root_dir joined with the relative path),
+        # so the processing ledger and stored file names match
+        relative_path = os.path.relpath(os.path.realpath(file_path), os.path.realpath(self.root_dir))
+        with self.lock:
+            self.candidates.setdefault(os.path.join(self.root_dir, relative_path), None)
+
+    def scan(self):
+        """Queue every media file whose size/mtime differs from when it was last reported"""
+        for file_path, _, stat in iter_media_files(self.root_dir):
+            if self.known.get(file_path) != (stat.st_size, stat.st_mtime):
+                with self.lock:
+                    self.candidates.setdefault(file_path, None)
+
+    def start(self):
+        """Start inotify/native watching if watchdog is installed; returns False when polling is needed"""
+        try:
+            from watchdog.observers import Observer
+            from watchdog.events import FileSystemEventHandler
+        except ImportError:
+            print(f"{Fore.YELLOW}watchdog is not installed, polling {self.root_dir} every {watch_poll_seconds}s "
+                  f"(pip install watchdog for instant notifications){Style.RESET_ALL}")
+            return False
+
+        watcher = self
+
+        class _Handler(FileSystemEventHandler):
+            def on_created(self, event):
+                if not event.is_directory:
+                    watcher.add_candidate(event.src_path)
+
+            def on_modified(self, event):
+                if not event.is_directory:
+                    watcher.add_candidate(event.src_path)
+
+            def on_moved(self, event):
+                if not event.is_directory:
+                    watcher.add_candidate(event.dest_path)
+
+        self.observer = Observer()
+        self.observer.schedule(_Handler(), self.root_dir, recursive=True)
+        self.observer.start()
+        print(f"{Fore.GREEN}Watching {self.root_dir} for new files (watchdog){Style.RESET_ALL}")
+        return True
+
+    def stop(self):
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer.join()
+
+    def ready_files(self):
+        """Candidates whose size and mtime have been stable for settle_seconds"""
+        now = time.time()
+        ready = []
+        with self.lock:
+            for file_path, seen in list(self.candidates.items()):
+                try:
+                    stat = os.stat(file_path)
+                except OSError:
+                    # Deleted or renamed before it settled
+                    del self.candidates[file_path]
+                    continue
+                signature = (stat.st_size, stat.st_mtime)
+                if seen is None or seen[0] != signature:
+                    self.candidates[file_path] = (signature, now)
+                elif stat.st_size > 0 and now - seen[1] >= self.settle_seconds:
+                    del self.candidates[file_path]
+                    self.known[file_path] = signature
+                    ready.append(file_path)
+        return sorted(ready)
+
+def _process_watched_file(file_path, vision_chain, object_chain, csv_filepath):
+    """Analyze one settled file from the watch folder unless the ledger already has it"""
+    processed_index = get_processed_file_index()
+    content_type = get_media_type(file_path)
+    try:
+        if content_type == 'image':
+            if processed_index.is_processed(file_path):
+                return
+            print(f"{Fore.CYAN}New image: {file_path}{Style.RESET_ALL}")
+            analyze_image(file_path, vision_chain, object_chain, csv_filepath)
+        else:
+            if processed_index.is_processed(file_path, interval_seconds=video_interval_seconds):
+                return
+            print(f"{Fore.CYAN}New video: {file_path}{Style.RESET_ALL}")
+            analyze_video(file_path, vision_chain, object_chain, interval_seconds=video_interval_seconds, csv_filepath=csv_filepath)
+        flush_vector_store()
+    except Exception as e:
+        print(f"{Fore.RED}❌ Error processing {file_path}: {str(e)}{Style.RESET_ALL}")
+
+def watch_folder(root_dir, vision_chain, object_chain, csv_filepath=None):
+    """Run until interrupted, analyzing files as they appear in (or change under) root_dir
+
+    The chains and vector store are created once by the caller and stay
+    warm between files. Files already in the processing ledger are skipped,
+    so restarting the watcher only picks up what it missed.
+    """
+    watcher = FolderWatcher(root_dir, watch_settle_seconds)
+    native = watcher.start()
+    # Pick up anything that arrived while the watcher was not running
+    watcher.scan()
+    last_scan = time.time()
+    print(f"{Fore.CYAN}Watch mode running, press Ctrl+C to stop{Style.RESET_ALL}")
+
+    try:
+        while True:
+            if not native and time.time() - last_scan >= watch_poll_seconds:
+                watcher.scan()
+                last_scan = time.time()
+            for file_path in watcher.ready_files():
+                _process_watched_file(file_path, vision_chain, object_chain, csv_filepath)
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print(f"\n{Fore.YELLOW}Stopping watch mode...{Style.RESET_ALL}")
+    finally:
+        watcher.stop()
+        flush_vector_store()
+        print_quality_skip_summary()
+
+# Settings copied into ingestion worker processes (they start from a fresh interpreter)
+pipeline_setting_names = [
+    'root_image_dir', 'db_name', 'db_collection_name', 'vision_model', 'embedding_model',
+    'enable_csv_logging', 'frame_sampling_mode', 'video_interval_seconds',
+    'decode_workers', 'parallel_decode_min_seconds', 'decode_segment_frames',
+    'decoder_backend', 'ffmpeg_binary', 'decoder_max_dimension',
+    'max_image_dimension', 'jpeg_quality', 'enable_jpeg_passthrough',
+    'enable_quality_gate', 'quality_min_brightness', 'quality_min_sharpness', 'quality_min_change', 'camera_quality_thresholds',
+    'enable_person_detector', 'person_detector_width', 'person_min_confidence', 'person_sparse_interval_seconds',
+    'enable_motion_gate', 'motion_gate_method', 'motion_threshold', 'camera_motion_thresholds', 'motion_gate_action',
+    'enable_frame_dedup', 'dedup_hash_method', 'dedup_max_distance', 'enable_fused_analysis',
+    'enable_async_inference', 'llm_max_concurrency', 'frame_concurrency',
+    'enable_inference_cache', 'inference_cache_file', 'inference_cache_max_bytes',
+    'vector_write_batch_size', 'vector_write_flush_seconds'
+]
+
+def create_chains(keep_alive=None):
+    """Create the vision (description) and object detection chains"""
+    llm = ChatOllama(model=vision_model, temperature=0.2, num_gpu=-1, keep_alive=keep_alive)
+    vision_chain = prompt_func | llm | StrOutputParser()
+    object_chain = prompt_func | llm | JsonOutputParser()
+    return vision_chain, object_chain
+
+class _QueuedVectorStore:
+    """Stand-in for the Chroma store in worker processes: documents go to the main process"""
+
+    def __init__(self, message_queue):
+        self.message_queue = message_queue
+
+    def add_documents(self, documents):
+        self.message_queue.put(('documents', documents))
+
+class _QueuedProcessedFileIndex(ProcessedFileIndex):
+    """Ledger for worker processes: reads go to SQLite, writes are applied by the main process
+
+    Writes travel through the same queue as the documents, after them, so the
+    main process applies them only once the preceding documents are stored.
+    """
+
+    def __init__(self, path, message_queue):
+        super().__init__(path)
+        self.message_queue = message_queue
+
+    def mark_in_progress(self, *args):
+        self.message_queue.put(('ledger', 'mark_in_progress', args))
+
+    def checkpoint(self, *args):
+        self.message_queue.put(('ledger', 'checkpoint', args))
+
+    def mark_processed(self, *args):
+        self.message_queue.put(('ledger', 'mark_processed', args))
+
+_worker_chains = None
+
+def _init_ingestion_worker(message_queue, settings):
+    global db, _csv_row_queue, _processed_file_index, _worker_chains
+    globals().update(settings)
+    db = _QueuedVectorStore(message_queue)
+    _csv_row_queue = message_queue
+    _processed_file_index = _QueuedProcessedFileIndex(f"./{db_name}/processed_files.sqlite3", message_queue)
+    _worker_chains = create_chains()
+
+def _ingest_file(content_type, file_path, csv_filepath):
+    """Analyze one image or video inside an ingestion worker process"""
+    vision_chain, object_chain = _worker_chains
+    start_time = time.time()
+    try:
+        if content_type == 'image':
+            analyze_image(file_path, vision_chain, object_chain, csv_filepath)
+            frames = 1
+        else:
+            frames = len(analyze_video(file_path, vision_chain, object_chain, interval_seconds=video_interval_seconds, csv_filepath=csv_filepath))
+        # Hand everything to the main process before reporting the file as finished
+        flush_vector_store()
+        return file_path, content_type, frames, time.time() - start_time, None
+    except Exception as e:
+        return file_path, content_type, 0, time.time() - start_time, str(e)
+
+def _apply_ingestion_messages(message_queue, write_failures):
+    """Main-process side of the worker queue: the single writer for Chroma, ledger and CSV
+
+    A failed message is logged and the queue keeps draining, so the workers
+    never block on a full queue. When a vector store write fails, the files
+    with documents still waiting in the write buffer are added to
+    write_failures. Their ledger updates wait behind those documents, so
+    they stay in progress unless a later flush succeeds.
+    """
+    write_buffer = get_vector_write_buffer()
+    ledger = get_processed_file_index()
+    while True:
+        message = message_queue.get()
+        if message is None:
+            break
+        try:
+            if message[0] == 'documents':
+                for doc in message[1]:
+                    write_buffer.add(doc)
+            elif message[0] == 'ledger':
+                write_buffer.add_callback(partial(getattr(ledger, message[1]), *message[2]))
+            elif message[0] == 'csv':
+                log_to_csv(message[1], message[2])
+            elif message[0] == 'quality_skip':
+                count_quality_skip(message[1], message[2])
+        except Exception as e:
+            print(f"{Fore.RED}Error applying '{message[0]}' results from a worker: {str(e)}{Style.RESET_ALL}")
+            if message[0] == 'documents':
+                with write_buffer.lock:
+                    write_failures.update(doc.metadata.get('file_name') for doc in write_buffer.documents)
+
+def ingest_files_in_parallel(files, workers, csv_filepath=None):
+    """Process (content_type, file_path) pairs across a pool of worker processes
+
+    files may be a generator such as iter_pending_media_files: each pair is
+    submitted as soon as it is produced, so the workers start while the
+    directory walk is still running.
+
+    Each worker owns its decoder and LLM chains. Documents, ledger updates and
+    CSV rows come back over a bounded queue and are written by this process
+    only, so the SQLite-backed stores are never written concurrently.
+    """
+    context = multiprocessing.get_context('spawn')
+    message_queue = context.Queue(maxsize=1000)
+    settings = {name: globals()[name] for name in pipeline_setting_names}
+
+    write_failures = set()
+    writer_thread = threading.Thread(target=_apply_ingestion_messages, args=(message_queue, write_failures), daemon=True)
+    writer_thread.start()
+
+    print(f"{Fore.MAGENTA}Processing files with {workers} worker processes...{Style.RESET_ALL}")
+    start_time = time.time()
+    finished_futures = queue.Queue()
+    submitted = 0
+    completed = 0
+    failed = 0
+    failed_files = set()
+    total_frames = 0
+    scanning = True
+
+    def report(future):
+        nonlocal completed, failed, total_frames
+        file_path, content_type, frames, elapsed, error = future.result()
+        completed += 1
+        total_frames += frames
+        wall_time = time.time() - start_time
+        # The total is only known once the walk has finished
+        total = f"{submitted}+" if scanning else str(submitted)
+        if error:
+            failed += 1
+            failed_files.add(file_path)
+            print(f"{Fore.RED}❌ [{completed}/{total}] {file_path}: {error}{Style.RESET_ALL}")
+        elif file_path in write_failures:
+            # Counted once the final flush shows whether a retry stored them
+            print(f"{Fore.YELLOW}⚠️  [{completed}/{total}] {file_path} ({content_type}, {frames} items, {elapsed:.1f}s), "
+                  f"vector store write failed, retrying{Style.RESET_ALL}")
+        else:
+            print(f"{Fore.GREEN}✅ [{completed}/{total}] {file_path} ({content_type}, {frames} items, {elapsed:.1f}s){Style.RESET_ALL}")
+        if scanning:
+            print(f"{Fore.CYAN}📊 Progress: {completed}/{total} files, {total_frames} items, "
+                  f"elapsed {wall_time:.0f}s, still scanning{Style.RESET_ALL}")
+        else:
+            eta = wall_time / completed * (submitted - completed)
+            print(f"{Fore.CYAN}📊 Progress: {completed}/{total} files, {total_frames} items, "
+                  f"elapsed {wall_time:.0f}s, ETA {eta:.0f}s{Style.RESET_ALL}")
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                 initializer=_init_ingestion_worker, initargs=(message_queue, settings)) as executor:
+            for content_type, file_path in files:
+                future = executor.submit(_ingest_file, content_type, file_path, csv_filepath)
+                future.add_done_callback(finished_futures.put)
+                submitted += 1
+                # Report whatever finished while the walk goes on
+                while not finished_futures.empty():
+                    report(finished_futures.get())
+            scanning = False
+            while completed < submitted:
+                report(finished_futures.get())
+    finally:
+        message_queue.put(None)
+        writer_thread.join()
+        try:
+            flush_vector_store()
+        except Exception as e:
+            print(f"{Fore.RED}Error writing to vector store: {str(e)}{Style.RESET_ALL}")
+            with _vector_write_buffer.lock:
+                write_failures.update(doc.metadata.get('file_name') for doc in _vector_write_buffer.documents)
+
+    # A file whose documents never reached the store was not marked done in the ledger
+    ledger = get_processed_file_index()
+    for file_path in sorted(write_failures - failed_files):
+        interval = video_interval_seconds if get_media_type(file_path) == 'video' else None
+        if not ledger.is_processed(file_path, interval_seconds=interval):
+            failed += 1
+            print(f"{Fore.RED}❌ {file_path}: results could not be written to the vector store{Style.RESET_ALL}")
+
+    print(f"{Fore.GREEN}Parallel ingestion finished: {completed - failed} succeeded, {failed} failed, "
+          f"{time.time() - start_time:.1f}s{Style.RESET_ALL}")
+
 def query_database(query_text, k=5, open_files=False):
     """Query the vector database for similar content"""
     
@@ -1330,8 +3361,71 @@ if __name__ == '__main__':
     parser.add_argument('--gdrive-folder', action='store_true', help='Force treat URL as Google Drive folder')
     parser.add_argument('--setup-gdrive', action='store_true', help='Show Google Drive API setup instructions')
     
+    # Video pipeline arguments
+    parser.add_argument('--quality-gate', action='store_true', help='Skip LLM analysis of dark, blurred and frozen video frames')
+    parser.add_argument('--person-detector', action='store_true', help='Fully analyze frames with people, sample frames without people sparsely')
+    parser.add_argument('--motion-gate', action='store_true', help='Skip LLM analysis of video frames without motion')
+    parser.add_argument('--motion-threshold', type=float, help='Default motion score threshold for the motion gate')
+    parser.add_argument('--dedup', action='store_true', help='Reuse the analysis of near-duplicate video frames')
+    parser.add_argument('--dedup-distance', type=int, help='Maximum perceptual hash distance for near-duplicates')
+    parser.add_argument('--fused', action='store_true', help='Detect objects and describe each image/frame in a single LLM call')
+    parser.add_argument('--async-llm', action='store_true', help='Run the object detection and description calls concurrently')
+    parser.add_argument('--llm-concurrency', type=int, help='Maximum concurrent requests to the Ollama server')
+    parser.add_argument('--frame-concurrency', type=int, help='Number of video frames analyzed concurrently')
+    parser.add_argument('--no-cache', action='store_true', help='Do not use the persistent LLM result cache')
+    parser.add_argument('--workers', type=int, help='Number of worker processes for local folder ingestion')
+    parser.add_argument('--decode-workers', type=int, help='Number of processes decoding segments of long videos in parallel')
+    parser.add_argument('--encode-workers', type=int, help='Number of processes encoding video frames for the vision model')
+    parser.add_argument('--decoder', choices=['ffmpeg', 'pyav', 'opencv'], help='Video decoder backend (default: opencv)')
+    parser.add_argument('--watch', action='store_true', help=f'Keep running and analyze new files as they appear in {root_image_dir}')
+    parser.add_argument('--stream', type=str, help='Analyze a live stream (rtsp://...) or replay a local video file as one')
+    parser.add_argument('--stream-interval', type=float, help='Seconds between analyzed stream frames')
+    parser.add_argument('--stream-buffer', type=int, help='Number of newest stream frames kept waiting for analysis')
+    parser.add_argument('--stream-duration', type=float, help='Stop stream analysis after this many seconds')
+    parser.add_argument('--max-dimension', type=int, help='Longest side of images sent to the vision model (0 = full resolution)')
+    parser.add_argument('--jpeg-quality', type=int, help='JPEG quality of images sent to the vision model')
+    
     args = parser.parse_args()
     
+    if args.quality_gate:
+        enable_quality_gate = True
+    if args.person_detector:
+        enable_person_detector = True
+    if args.motion_gate:
+        enable_motion_gate = True
+    if args.motion_threshold is not None:
+        motion_threshold = args.motion_threshold
+    if args.dedup:
+        enable_frame_dedup = True
+    if args.dedup_distance is not None:
+        dedup_max_distance = args.dedup_distance
+    if args.fused:
+        enable_fused_analysis = True
+    if args.async_llm:
+        enable_async_inference = True
+    if args.llm_concurrency is not None:
+        llm_max_concurrency = args.llm_concurrency
+    if args.frame_concurrency is not None:
+        frame_concurrency = args.frame_concurrency
+    if args.no_cache:
+        enable_inference_cache = False
+    if args.workers is not None:
+        ingestion_workers = args.workers
+    if args.decode_workers is not None:
+        decode_workers = args.decode_workers
+    if args.decoder:
+        decoder_backend = args.decoder
+    if args.encode_workers is not None:
+        encode_workers = args.encode_workers
+    if args.stream_interval is not None:
+        stream_interval_seconds = args.stream_interval
+    if args.stream_buffer is not None:
+        stream_buffer_size = args.stream_buffer
+    if args.max_dimension is not None:
+        max_image_dimension = args.max_dimension
+    if args.jpeg_quality is not None:
+        jpeg_quality = args.jpeg_quality
+    
     # Handle Google Drive setup help
     if args.setup_gdrive:
         print(f"{Fore.CYAN}🔧 Google Drive API Setup Instructions{Style.RESET_ALL}")
@@ -1370,6 +3464,26 @@ if __name__ == '__main__':
     # Setup CSV logging for processing mode
     csv_filepath = setup_csv_logging()
     
+    # Handle watch-folder mode
+    if args.watch:
+        vision_chain, object_chain = create_chains(keep_alive=watch_keep_alive)
+        db = Chroma(
+            collection_name=db_collection_name,
+            embedding_function=OllamaEmbeddings(model=embedding_model, keep_alive=watch_keep_alive),
+            persist_directory=f"./{db_name}")
+        watch_folder(root_image_dir, vision_chain, object_chain, csv_filepath)
+        sys.exit(0)
+    
+    # Handle live stream mode
+    if args.stream:
+        vision_chain, object_chain = create_chains()
+        db = Chroma(
+            collection_name=db_collection_name,
+            embedding_function=OllamaEmbeddings(model=embedding_model),
+            persist_directory=f"./{db_name}")
+        analyze_stream(args.stream, vision_chain, object_chain, csv_filepath=csv_filepath, duration_seconds=args.stream_duration)
+        sys.exit(0)
+    
     # Check if URL is provided as legacy positional argument
     if args.url_or_query:
         input_arg = args.url_or_query
@@ -1440,6 +3554,8 @@ if __name__ == '__main__':
                     print(f"{Fore.GREEN}Results logged to: {csv_filepath}{Style.RESET_ALL}")
                 for i, frame_details in enumerate(frame_details_list):
                     print(f"Frame {i+1}: {frame_details.timestamp:.2f}s - {len(frame_details.detected_objects)} objects detected")
+            elif get_processed_file_index().is_processed(input_arg, interval_seconds=interval):
+                print(f"\n{Fore.GREEN}Nothing new to analyze, all sampled frames from URL are already stored{Style.RESET_ALL}")
             else:
                 print(f"{Fore.RED}Failed to process video from URL{Style.RESET_ALL}")
             
@@ -1458,13 +3574,6 @@ if __name__ == '__main__':
     print("💡 TIP: To process a video from URL, use: python codev1.1.py <video_url> [interval_seconds]")
     print()
     
-    # Analyze directory structure for CCTV setup
-    analyze_cctv_directory_structure(root_image_dir)
-    
-    # Get both image and video files
-    image_files = get_jpeg_files(root_image_dir)
-    video_files = get_video_files(root_image_dir)
-    
     embedding_function = OllamaEmbeddings(model=embedding_model)
 
     llm = ChatOllama(model=vision_model, temperature=0.2, num_gpu=-1)
@@ -1476,83 +3585,75 @@ if __name__ == '__main__':
         embedding_function=embedding_function,
         persist_directory=f"./{db_name}")
 
-    processed_files = get_processed_files()
-
-    # Process images
-    if image_files:
-        print(f"{Fore.MAGENTA}Processing {len(image_files)} image files...{Style.RESET_ALL}")
-        counter = 1
-        for file in image_files:
-            print('---------------------------------------------------------------')
-            print(f'{counter} / {len(image_files)} (Images)')
-            print(file)
-            print('\n\n')
-            if file in processed_files:
-                print(f'{Fore.LIGHTYELLOW_EX}FILE ALREADY PROCESSED, SKIPPED{Style.RESET_ALL}')
-            else:
+    # One walk of the tree for both images and videos; each file is processed
+    # as soon as the walk finds it, and the folder summaries follow at the end
+    print(f"{Fore.CYAN}Scanning for image and video files in: {root_image_dir}{Style.RESET_ALL}")
+    found_files = {'image': [], 'video': [], 'skipped': []}
+    pending_files = iter_pending_media_files(root_image_dir, found_files)
+
+    if ingestion_workers > 1:
+        ingest_files_in_parallel(pending_files, ingestion_workers, csv_filepath)
+    else:
+        image_counter = 1
+        video_counter = 1
+        for media_type, file in pending_files:
+            # Process image
+            if media_type == 'image':
+                print('---------------------------------------------------------------')
+                print(f'{image_counter} (Images)')
+                print(file)
+                print('\n\n')
                 analyze_image(file, vision_chain, object_chain, csv_filepath)
-            counter += 1
+                image_counter += 1
+                continue
 
-    # Process videos
-    if video_files:
-        print(f"\n{Fore.MAGENTA}Processing {len(video_files)} video files...{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}Perfect for CCTV camera setups with multiple folders!{Style.RESET_ALL}")
-        
-        # Group videos by camera folder for better organization
-        videos_by_folder = {}
-        for video_file in video_files:
-            folder_path = os.path.dirname(video_file)
-            folder_name = os.path.basename(folder_path) if folder_path != root_image_dir else "Root"
-            if folder_name not in videos_by_folder:
-                videos_by_folder[folder_name] = []
-            videos_by_folder[folder_name].append(video_file)
-        
-        print(f"{Fore.CYAN}Videos organized by camera/folder:{Style.RESET_ALL}")
-        for folder, videos in videos_by_folder.items():
-            print(f"  📹 {folder}: {len(videos)} video(s)")
-        print()
-        
-        counter = 1
-        for video_file in video_files:
-            # Determine camera/folder context
+            # Process video, determining camera/folder context
+            video_file = file
             folder_path = os.path.dirname(video_file)
             folder_name = os.path.basename(folder_path) if folder_path != root_image_dir else "Root"
             video_filename = os.path.basename(video_file)
             
             print('=' * 80)
-            print(f'{Fore.CYAN}📹 VIDEO {counter} / {len(video_files)}{Style.RESET_ALL}')
+            print(f'{Fore.CYAN}📹 VIDEO {video_counter}{Style.RESET_ALL}')
             print(f'{Fore.CYAN}📁 Camera/Folder: {folder_name}{Style.RESET_ALL}')
             print(f'{Fore.CYAN}🎬 File: {video_filename}{Style.RESET_ALL}')
             print(f'{Fore.CYAN}📍 Full Path: {video_file}{Style.RESET_ALL}')
             print('=' * 80)
             print('\n')
             
-            # Check if video has already been processed by looking for any frames from this video
-            video_already_processed = any(
-                pf.startswith(video_file) and 'frame_' in pf 
-                for pf in processed_files
-            )
-            
-            if video_already_processed:
-                print(f'{Fore.LIGHTYELLOW_EX}VIDEO ALREADY PROCESSED, SKIPPED{Style.RESET_ALL}')
-                print(f'{Fore.LIGHTYELLOW_EX}(Found existing frame data in database){Style.RESET_ALL}')
-            else:
-                print(f'{Fore.GREEN}🚀 Starting analysis...{Style.RESET_ALL}')
-                # Process video with 2-second intervals (you can change this)
-                try:
-                    frame_details_list = analyze_video(video_file, vision_chain, object_chain, interval_seconds=2, csv_filepath=csv_filepath)
-                    if frame_details_list:
-                        total_objects = sum(len(frame.detected_objects) for frame in frame_details_list)
-                        print(f'{Fore.GREEN}✅ Successfully processed {len(frame_details_list)} frames from {folder_name}/{video_filename}{Style.RESET_ALL}')
-                        print(f'{Fore.GREEN}🔍 Total objects detected: {total_objects}{Style.RESET_ALL}')
-                    else:
-                        print(f'{Fore.YELLOW}⚠️  No frames extracted from {folder_name}/{video_filename}{Style.RESET_ALL}')
-                except Exception as e:
-                    print(f'{Fore.RED}❌ Error processing {folder_name}/{video_filename}: {str(e)}{Style.RESET_ALL}')
+            print(f'{Fore.GREEN}🚀 Starting analysis...{Style.RESET_ALL}')
+            # Process video with video_interval_seconds intervals (you can change this)
+            try:
+                frame_details_list = analyze_video(video_file, vision_chain, object_chain, interval_seconds=video_interval_seconds, csv_filepath=csv_filepath)
+                if frame_details_list:
+                    total_objects = sum(len(frame.detected_objects) for frame in frame_details_list)
+                    print(f'{Fore.GREEN}✅ Successfully processed {len(frame_details_list)} frames from {folder_name}/{video_filename}{Style.RESET_ALL}')
+                    print(f'{Fore.GREEN}🔍 Total objects detected: {total_objects}{Style.RESET_ALL}')
+                elif get_processed_file_index().is_processed(video_file, interval_seconds=video_interval_seconds):
+                    print(f'{Fore.GREEN}✅ Nothing new to analyze in {folder_name}/{video_filename}, all sampled frames already stored{Style.RESET_ALL}')
+                else:
+                    print(f'{Fore.YELLOW}⚠️  No frames extracted from {folder_name}/{video_filename}{Style.RESET_ALL}')
+            except Exception as e:
+                print(f'{Fore.RED}❌ Error processing {folder_name}/{video_filename}: {str(e)}{Style.RESET_ALL}')
             
-            counter += 1
+            video_counter += 1
             print('\n')
     
+    image_files = found_files['image']
+    video_files = found_files['video']
+    if found_files['skipped']:
+        print(f"{Fore.LIGHTYELLOW_EX}{len(found_files['skipped'])} files already processed "
+              f"(found in processed-file index), skipped{Style.RESET_ALL}")
+
+    # Directory structure for CCTV setup
+    print()
+    analyze_cctv_directory_structure(root_image_dir)
+    print_image_file_summary(root_image_dir, image_files)
+    print_video_file_summary(root_image_dir, video_files)
+    
+    flush_vector_store()
+    print_quality_skip_summary()
+    
     # Final CCTV processing summary
     total_files = len(image_files) + len(video_files)
     if total_files > 0:
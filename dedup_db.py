@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Database Deduplication Tool
+
+One-off script that collapses duplicate documents in the vector database.
+Older versions of the pipeline stored every run under a random id, so
+re-processing a file or frame added another copy of it. Images are
+grouped by file and model, video frames by file and frame number; one
+document per group is kept (an analyzed frame over a frame gate record)
+and the rest are deleted. With --rekey the kept document is also moved to
+the deterministic id the pipeline now uses, so future runs upsert over it.
+
+Usage:
+    python dedup_db.py              # Report duplicates only (dry run)
+    python dedup_db.py --apply      # Delete duplicates
+    python dedup_db.py --apply --rekey
+"""
+
+import os
+import argparse
+import importlib.util
+import chromadb
+from collections import defaultdict
+from colorama import Fore, Style
+
+# Configuration (should match your main script)
+db_name = 'db_photos'
+db_collection_name = "photo_collection"
+
+# Document ids must match the pipeline, so reuse its helpers from codev1.3.py
+pipeline_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'codev1.3.py')
+
+def load_pipeline_module():
+    """Load codev1.3.py as a module"""
+    spec = importlib.util.spec_from_file_location('codev1_3', pipeline_file)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def get_all_metadata(collection, page_size=1000):
+    """Fetch (id, metadata) for every document in the collection"""
+    entries = []
+    offset = 0
+    while True:
+        page = collection.get(include=['metadatas'], limit=page_size, offset=offset)
+        if not page['ids']:
+            break
+        entries.extend(zip(page['ids'], page['metadatas']))
+        offset += len(page['ids'])
+    return entries
+
+def find_duplicate_groups(pipeline, entries):
+    """Group document ids by image and model, or by video frame; returns {canonical_id: [ids]}"""
+    groups = defaultdict(list)
+    for doc_id, metadata in entries:
+        metadata = metadata or {}
+        file_name = metadata.get('file_name', '')
+        if metadata.get('content_type') == 'video_frame':
+            canonical_id = pipeline.make_document_id(file_name, metadata.get('frame_number'))
+        else:
+            canonical_id = pipeline.make_document_id(file_name, None, metadata.get('generated_with', ''))
+        groups[canonical_id].append(doc_id)
+    return groups
+
+def deduplicate(apply_changes=False, rekey=False):
+    pipeline = load_pipeline_module()
+
+    client = chromadb.PersistentClient(path=f"./{db_name}")
+    collection = client.get_collection(db_collection_name)
+
+    print(f"{Fore.CYAN}Scanning {collection.count()} documents in ./{db_name} ({db_collection_name})...{Style.RESET_ALL}")
+    entries = get_all_metadata(collection)
+    groups = find_duplicate_groups(pipeline, entries)
+
+    to_delete = []
+    to_rekey = []
+    metadata_by_id = dict(entries)
+    for canonical_id, ids in groups.items():
+        # Prefer an analyzed document, then one already stored under the deterministic id
+        candidates = [doc_id for doc_id in ids
+                      if (metadata_by_id[doc_id] or {}).get('generated_with') != 'frame_gate'] or ids
+        keep_id = canonical_id if canonical_id in candidates else candidates[0]
+        to_delete.extend(doc_id for doc_id in ids if doc_id != keep_id)
+        if rekey and keep_id != canonical_id:
+            to_rekey.append((keep_id, canonical_id))
+
+    print(f"Unique files/frames: {len(groups)}")
+    print(f"Duplicate documents: {len(to_delete)}")
+    if rekey:
+        print(f"Documents to move to deterministic ids: {len(to_rekey)}")
+
+    if not apply_changes:
+        print(f"\n{Fore.YELLOW}Dry run - nothing was changed. Use --apply to delete duplicates.{Style.RESET_ALL}")
+        return
+
+    batch_size = 500
+    for i in range(0, len(to_delete), batch_size):
+        collection.delete(ids=to_delete[i:i + batch_size])
+    print(f"{Fore.GREEN}Deleted {len(to_delete)} duplicate documents{Style.RESET_ALL}")
+
+    for i in range(0, len(to_rekey), batch_size):
+        batch = to_rekey[i:i + batch_size]
+        old_ids = [old_id for old_id, _ in batch]
+        new_ids = dict(batch)
+        # Copy embeddings as-is so nothing has to be re-embedded
+        existing = collection.get(ids=old_ids, include=['embeddings', 'documents', 'metadatas'])
+        collection.upsert(
+            ids=[new_ids[old_id] for old_id in existing['ids']],
+            embeddings=existing['embeddings'],
+            documents=existing['documents'],
+            metadatas=existing['metadatas'])
+        collection.delete(ids=existing['ids'])
+    if rekey:
+        print(f"{Fore.GREEN}Moved {len(to_rekey)} documents to deterministic ids{Style.RESET_ALL}")
+
+def main():
+    parser = argparse.ArgumentParser(description='Remove duplicate documents from the object detection database')
+    parser.add_argument('--apply', action='store_true', help='Delete duplicates (default is a dry run)')
+    parser.add_argument('--rekey', action='store_true', help='Also move kept documents to deterministic ids')
+    args = parser.parse_args()
+
+    try:
+        deduplicate(apply_changes=args.apply, rekey=args.rekey)
+    except Exception as e:
+        print(f"{Fore.RED}Error deduplicating database: {str(e)}{Style.RESET_ALL}")
+        print("Make sure the database exists and is not being written by another process.")
+
+if __name__ == "__main__":
+    main()